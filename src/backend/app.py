@@ -14,6 +14,7 @@ Designed to run on Red Lion Flex Edge industrial edge computing platform.
 """
 
 import asyncio
+import functools
 import json
 import logging
 import os
@@ -21,7 +22,7 @@ import signal
 import sys
 import time
 from pathlib import Path
-from typing import Set, Optional
+from typing import Dict, Optional, Set, Tuple, Union
 from dataclasses import dataclass
 import argparse
 
@@ -31,6 +32,7 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from aiohttp import web
 import aiohttp
 
+from json_codec import json_bytes, json_text, json_loads
 from mrs1000_parser import MRS1000Parser, MRS1000SimulatedParser, ScanData
 from udp_receiver import MRS1000Receiver, ReceiverConfig
 from measurement_evaluator import (
@@ -49,6 +51,23 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def json_response(data, status: int = 200) -> web.Response:
+    """Build a JSON HTTP response encoded with json_bytes"""
+    return web.Response(body=json_bytes(data), status=status,
+                        content_type='application/json')
+
+
+# Static WebSocket replies
+ACK_SET_COMPACT_MODE = json_text({'type': 'ack', 'command': 'set_compact_mode'})
+
+# MRS1000 default scan rate (Hz), used until a live scan reports its own
+DEFAULT_SCAN_RATE = 12.5
+
+# Consecutive messages (scans and results) a slow WebSocket client may skip
+# before it is closed; about two seconds at the default scan rate
+WS_MAX_SKIPPED_FRAMES = 50
+
+
 @dataclass
 class AppConfig:
     """Application configuration"""
@@ -67,8 +86,13 @@ class AppConfig:
 
     # Data settings
     compact_mode: bool = True  # Send compact data format
+    binary_mode: bool = True   # Send compact scans as binary frames
     max_clients: int = 10
 
+    # Evaluation settings
+    skip_idle_evaluation: bool = False  # Skip scans with no WebSocket client or PLC server
+    short_circuit_on_bad: bool = False  # Mark zones after the first BAD one STALE (result 5)
+
     # Paths
     static_path: str = "../frontend"
     config_path: str = "../config/products.json"
@@ -100,16 +124,32 @@ class LidarVisualizationApp:
         self.receiver: Optional[MRS1000Receiver] = None
         self.simulator: Optional[MRS1000SimulatedParser] = None
 
-        # WebSocket clients
-        self.ws_clients: Set[web.WebSocketResponse] = set()
+        # WebSocket clients (copy-on-write: replaced on connect/disconnect so
+        # broadcasts can use it as a snapshot without copying)
+        self.ws_clients: Tuple[web.WebSocketResponse, ...] = ()
+
+        # Per-client send that missed its deadline and is still in flight,
+        # and messages skipped while it was
+        self._ws_late: Dict[web.WebSocketResponse, asyncio.Task] = {}
+        self._ws_skipped: Dict[web.WebSocketResponse, int] = {}
+
+        # Fire-and-forget tasks, referenced until done so they aren't collected
+        self._background_tasks: Set[asyncio.Task] = set()
 
         # Latest scan data (for new clients)
         self.latest_scan: Optional[ScanData] = None
 
+        # Encoded scan message cache (valid for one scan object and format)
+        # (bytes for binary scan frames, str for JSON text frames)
+        self._scan_payload: Optional[Union[bytes, str]] = None
+        self._scan_payload_scan: Optional[ScanData] = None
+        self._scan_payload_format: Optional[str] = None
+
         # Statistics
         self.stats = {
             'scans_received': 0,
             'scans_sent': 0,
+            'scans_dropped': 0,
             'ws_messages_sent': 0,
             'start_time': time.time(),
         }
@@ -118,15 +158,26 @@ class LidarVisualizationApp:
         self._running = False
         self._simulation_task: Optional[asyncio.Task] = None
 
+        # Event loop (captured in start() for thread-safe scheduling)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Single-slot scan hand-off: producers overwrite latest_scan and set
+        # the event, one broadcast task always sends the newest scan
+        self._scan_ready: Optional[asyncio.Event] = None
+        self._broadcast_task: Optional[asyncio.Task] = None
+
         # Determine static files path
         self.static_path = Path(__file__).parent / self.config.static_path
         if not self.static_path.exists():
             logger.warning(f"Static path not found: {self.static_path}")
             self.static_path = Path(__file__).parent.parent / "frontend"
+        self._index_path = self.static_path / 'index.html'
+        self._index_exists = self._index_path.exists()
 
         # Measurement evaluation
         config_path = Path(__file__).parent / self.config.config_path
-        self.evaluator = MeasurementEvaluator(str(config_path))
+        self.evaluator = MeasurementEvaluator(
+            str(config_path), short_circuit_on_bad=self.config.short_circuit_on_bad)
         self.evaluator.add_result_callback(self._on_measurement_result)
 
         # Create example product if none exist
@@ -139,14 +190,34 @@ class LidarVisualizationApp:
         self.opcua_server: Optional[OPCUAServerWrapper] = None
         self.modbus_server: Optional[ModbusTCPServer] = None
         self.ethernetip_server: Optional[EtherNetIPServerWrapper] = None
+        self._plc_servers_running = False  # Any PLC/SCADA server started
 
         # Latest measurement result
         self.latest_result: Optional[ProductConfig] = None
 
+        # Pre-encoded config message sent to each new WebSocket client
+        self._config_frame: str = ''
+
     async def start(self) -> None:
         """Start the application"""
         logger.info("Starting MRS1000 LIDAR Visualization App")
         self._running = True
+        self._loop = asyncio.get_running_loop()
+        self._scan_ready = asyncio.Event()
+        self._broadcast_task = asyncio.create_task(self._broadcast_loop())
+
+        # Client config is fixed for the lifetime of the app; encode it once
+        self._config_frame = json_text({
+            'type': 'config',
+            'data': {
+                'simulation_mode': self.config.simulation_mode,
+                'scan_rate': self.config.simulation_rate if self.config.simulation_mode else DEFAULT_SCAN_RATE,
+                'layers': 4,
+                'fov_horizontal': 275,
+                'fov_vertical': 5,
+                'max_range': 64,
+            }
+        })
 
         if self.config.simulation_mode:
             logger.info("Running in SIMULATION mode")
@@ -164,15 +235,14 @@ class LidarVisualizationApp:
 
     async def _start_communication_servers(self) -> None:
         """Start OPC-UA and Modbus TCP servers"""
-        loop = asyncio.get_event_loop()
-
         # Start OPC-UA server for Ignition
         if self.config.enable_opcua:
             try:
                 self.opcua_server = OPCUAServerWrapper(
                     f"opc.tcp://0.0.0.0:{self.config.opcua_port}/lidar/"
                 )
-                if self.opcua_server.start(loop):
+                if self.opcua_server.start(self._loop):
+                    self._plc_servers_running = True
                     logger.info(f"OPC-UA server started on port {self.config.opcua_port}")
                 else:
                     logger.warning("OPC-UA server failed to start (library may not be installed)")
@@ -190,6 +260,7 @@ class LidarVisualizationApp:
                 self.modbus_server.set_product_callback(self.evaluator.set_active_product)
 
                 if self.modbus_server.start():
+                    self._plc_servers_running = True
                     logger.info(f"Modbus TCP server started on port {self.config.modbus_port}")
                 else:
                     logger.warning("Modbus server failed to start")
@@ -205,6 +276,7 @@ class LidarVisualizationApp:
                     udp_port=self.config.ethernetip_udp_port
                 )
                 if await self.ethernetip_server.start():
+                    self._plc_servers_running = True
                     logger.info(f"EtherNet/IP server started - TCP:{self.config.ethernetip_tcp_port}, UDP:{self.config.ethernetip_udp_port}")
                 else:
                     logger.warning("EtherNet/IP server failed to start")
@@ -233,54 +305,48 @@ class LidarVisualizationApp:
                 zone_measurements.append(int(zone.last_measurement * 1000) if zone.last_measurement else 0)
                 zone_results.append(int(zone.last_result))
 
-            self.ethernetip_server.update_measurement_data(
+            # The EtherNet/IP server lives on the event loop; this callback
+            # runs on the evaluator's callback thread
+            self._loop.call_soon_threadsafe(functools.partial(
+                self.ethernetip_server.update_measurement_data,
                 status=3 if self.config.simulation_mode else 1,  # 3=Sim, 1=Running
                 product_id=product.id,
                 overall_result=int(product.last_result),
                 zone_count=len(product.zones),
-                scan_counter=stats.get('total_evaluations', 0),
+                scan_counter=stats.get('evaluation_count', 0),
                 good_count=stats.get('good_count', 0),
                 bad_count=stats.get('bad_count', 0),
-                good_rate=stats.get('good_rate', 0.0),
+                good_rate=stats.get('good_rate', 0.0) * 100,  # Fraction -> percent
                 zone_measurements=zone_measurements,
                 zone_results=zone_results
+            ))
+
+        # Broadcast to WebSocket clients; encode here with the statistics
+        # already gathered so the event loop only has to send the text
+        if self.ws_clients:
+            payload = json_text({
+                'type': 'measurement',
+                'data': product.to_dict(fast=True),
+                'statistics': stats,
+            })
+            self._loop.call_soon_threadsafe(
+                self._spawn,
+                self._send_to_clients(payload, self._scan_period(self.latest_scan))
             )
 
-        # Broadcast to WebSocket clients
-        asyncio.run_coroutine_threadsafe(
-            self._broadcast_measurement_result(product),
-            asyncio.get_event_loop()
-        )
-
-    async def _broadcast_measurement_result(self, product: ProductConfig) -> None:
-        """Broadcast measurement result to WebSocket clients"""
-        if not self.ws_clients:
-            return
-
-        message = json.dumps({
-            'type': 'measurement',
-            'data': product.to_dict(),
-            'statistics': self.evaluator.get_statistics(),
-        })
-
-        for ws in list(self.ws_clients):
-            try:
-                await ws.send_str(message)
-            except Exception:
-                pass
-
     async def stop(self) -> None:
         """Stop the application"""
         logger.info("Stopping application...")
         self._running = False
 
-        # Stop simulation
-        if self._simulation_task:
-            self._simulation_task.cancel()
-            try:
-                await self._simulation_task
-            except asyncio.CancelledError:
-                pass
+        # Stop simulation and broadcasting
+        for task in (self._simulation_task, self._broadcast_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
 
         # Stop receiver
         if self.receiver:
@@ -295,7 +361,7 @@ class LidarVisualizationApp:
             await self.ethernetip_server.stop()
 
         # Close all WebSocket connections
-        for ws in list(self.ws_clients):
+        for ws in self.ws_clients:
             await ws.close()
 
         logger.info("Application stopped")
@@ -319,15 +385,17 @@ class LidarVisualizationApp:
         self.stats['scans_received'] += 1
         self.latest_scan = scan
 
-        # Schedule async broadcast
-        asyncio.run_coroutine_threadsafe(
-            self._broadcast_scan(scan),
-            asyncio.get_event_loop()
-        )
+        # Every scan is evaluated (on the receiver thread, off the event loop)
+        self._evaluate_scan(scan)
+
+        # Wake the broadcast task; scans arriving before it runs are
+        # superseded by the newest one
+        self._loop.call_soon_threadsafe(self._scan_ready.set)
 
     async def _simulation_loop(self) -> None:
         """Generate simulated scan data"""
         interval = 1.0 / self.config.simulation_rate
+        next_time = self._loop.time()
 
         while self._running:
             try:
@@ -335,12 +403,18 @@ class LidarVisualizationApp:
                 scan = self.simulator.generate_scan()
                 self.stats['scans_received'] += 1
                 self.latest_scan = scan
+                self._evaluate_scan(scan)
 
-                # Broadcast to clients
-                await self._broadcast_scan(scan)
+                # Hand off to the broadcast task
+                self._scan_ready.set()
 
-                # Wait for next scan
-                await asyncio.sleep(interval)
+                # Wait for next scan deadline (generation time is not added
+                # on top); resync instead of bursting if a period was missed
+                next_time += interval
+                now = self._loop.time()
+                if next_time < now - interval:
+                    next_time = now
+                await asyncio.sleep(max(0.0, next_time - now))
 
             except asyncio.CancelledError:
                 break
@@ -348,38 +422,147 @@ class LidarVisualizationApp:
                 logger.error(f"Simulation error: {e}")
                 await asyncio.sleep(0.1)
 
-    async def _broadcast_scan(self, scan: ScanData) -> None:
-        """Broadcast scan data to all connected WebSocket clients"""
-        # Evaluate measurements
+    def _evaluate_scan(self, scan: ScanData) -> None:
+        """Evaluate a scan; runs for every scan, unlike the broadcast"""
+        # Opt-in: the REST API results freeze while nothing else is attached
+        if self.config.skip_idle_evaluation and not (self.ws_clients or self._plc_servers_running):
+            return
         self.evaluator.evaluate_scan(scan)
 
+    async def _broadcast_loop(self) -> None:
+        """Broadcast the latest scan each time a new one is ready"""
+        last_received = self.stats['scans_received']
+
+        while self._running:
+            try:
+                await self._scan_ready.wait()
+                self._scan_ready.clear()
+
+                # Count scans superseded before the broadcast got to them
+                # (they were still evaluated, only not sent)
+                received = self.stats['scans_received']
+                self.stats['scans_dropped'] += max(0, received - last_received - 1)
+                last_received = received
+
+                await self._broadcast_scan(self.latest_scan)
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Broadcast error: {e}")
+
+    async def _broadcast_scan(self, scan: ScanData) -> None:
+        """Broadcast scan data to all connected WebSocket clients"""
         if not self.ws_clients:
             return
 
-        # Prepare data
-        if self.config.compact_mode:
-            data = scan.to_compact_dict()
-        else:
-            data = scan.to_dict()
+        # Encode once and share the same bytes with every client
+        payload = self._encode_scan(scan)
 
-        message = json.dumps({
-            'type': 'scan',
-            'data': data,
-        })
+        self.stats['ws_messages_sent'] += await self._send_to_clients(
+            payload, self._scan_period(scan))
+        self.stats['scans_sent'] += 1
 
-        # Send to all clients
-        dead_clients = set()
+    def _scan_period(self, scan: Optional[ScanData]) -> float:
+        """Seconds between scans, used as the WebSocket send deadline"""
+        if self.config.simulation_mode:
+            return 1.0 / self.config.simulation_rate
+        if scan is not None and scan.frequency > 0:
+            return 1.0 / scan.frequency
+        return 1.0 / DEFAULT_SCAN_RATE
+
+    def _spawn(self, coro) -> asyncio.Task:
+        """Start a fire-and-forget task and keep it referenced until done"""
+        task = self._loop.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
+    async def _send_to_clients(self, payload: Union[bytes, str], timeout: float) -> int:
+        """
+        Send a payload to all WebSocket clients concurrently
+
+        bytes go out as binary frames, str (JSON) as text frames.
+
+        Waits at most timeout seconds. A send still running by then is left
+        to finish (cancelling it would cut the frame), and that client skips
+        messages until it has caught up. It is closed only after
+        WS_MAX_SKIPPED_FRAMES skips in a row or on a send error.
+
+        Returns:
+            Number of clients the payload was delivered to within timeout
+        """
+        started = {}
         for ws in self.ws_clients:
-            try:
-                await ws.send_str(message)
-                self.stats['ws_messages_sent'] += 1
-            except Exception as e:
-                logger.debug(f"Failed to send to client: {e}")
-                dead_clients.add(ws)
+            if ws in self._ws_late:
+                skipped = self._ws_skipped.get(ws, 0) + 1
+                self._ws_skipped[ws] = skipped
+                if skipped >= WS_MAX_SKIPPED_FRAMES:
+                    logger.info(f"Closing WebSocket client after {skipped} skipped messages")
+                    self._drop_client(ws)
+                continue
+
+            self._ws_skipped.pop(ws, None)
+            task = self._loop.create_task(self._send_payload(ws, payload))
+            task.add_done_callback(functools.partial(self._on_send_done, ws))
+            started[task] = ws
+
+        if not started:
+            return 0
+
+        done, late = await asyncio.wait(started, timeout=timeout)
+        for task in late:
+            self._ws_late[started[task]] = task
+        return sum(1 for task in done if not task.cancelled() and task.exception() is None)
+
+    @staticmethod
+    def _send_payload(ws: web.WebSocketResponse, payload: Union[bytes, str]):
+        """Send bytes as a binary frame and str as a text frame"""
+        if isinstance(payload, str):
+            return ws.send_str(payload)
+        return ws.send_bytes(payload)
+
+    def _on_send_done(self, ws: web.WebSocketResponse, task: asyncio.Task) -> None:
+        """Clear a client's late send; drop the client if the send failed"""
+        if self._ws_late.get(ws) is task:
+            del self._ws_late[ws]
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            logger.debug(f"Failed to send to client: {error!r}")
+            self._drop_client(ws)
+
+    def _drop_client(self, ws: web.WebSocketResponse) -> None:
+        """Remove a client and close its connection in the background"""
+        self._remove_client(ws)
+        if not ws.closed:
+            self._spawn(ws.close())
+
+    def _encode_scan(self, scan: ScanData) -> Union[bytes, str]:
+        """Encode a scan message, reusing the cached bytes for the same scan"""
+        if not self.config.compact_mode:
+            scan_format = 'full'
+        elif self.config.binary_mode:
+            scan_format = 'binary'
+        else:
+            scan_format = 'compact'
 
-        # Remove dead clients
-        self.ws_clients -= dead_clients
-        self.stats['scans_sent'] += 1
+        if self._scan_payload_scan is scan and self._scan_payload_format == scan_format:
+            return self._scan_payload
+
+        # Prepare data
+        if scan_format == 'binary':
+            self._scan_payload = scan.to_binary()
+        else:
+            data = scan.to_compact_dict() if scan_format == 'compact' else scan.to_dict()
+            self._scan_payload = json_text({
+                'type': 'scan',
+                'data': data,
+            })
+        self._scan_payload_scan = scan
+        self._scan_payload_format = scan_format
+        return self._scan_payload
 
     async def _start_web_server(self) -> None:
         """Start the HTTP and WebSocket server"""
@@ -425,9 +608,8 @@ class LidarVisualizationApp:
 
     async def _handle_index(self, request: web.Request) -> web.Response:
         """Serve index.html"""
-        index_path = self.static_path / 'index.html'
-        if index_path.exists():
-            return web.FileResponse(index_path)
+        if self._index_exists:
+            return web.FileResponse(self._index_path)
         return web.Response(text="Frontend not found", status=404)
 
     async def _handle_websocket(self, request: web.Request) -> web.WebSocketResponse:
@@ -440,71 +622,63 @@ class LidarVisualizationApp:
             await ws.close(message=b"Too many clients")
             return ws
 
-        self.ws_clients.add(ws)
+        self.ws_clients += (ws,)
         client_ip = request.remote
         logger.info(f"WebSocket client connected: {client_ip} "
                     f"(total: {len(self.ws_clients)})")
 
         # Send initial configuration
-        await ws.send_str(json.dumps({
-            'type': 'config',
-            'data': {
-                'simulation_mode': self.config.simulation_mode,
-                'scan_rate': self.config.simulation_rate if self.config.simulation_mode else 12.5,
-                'layers': 4,
-                'fov_horizontal': 275,
-                'fov_vertical': 5,
-                'max_range': 64,
-            }
-        }))
+        await ws.send_str(self._config_frame)
 
         # Send latest scan if available
         if self.latest_scan:
-            data = (self.latest_scan.to_compact_dict()
-                    if self.config.compact_mode else self.latest_scan.to_dict())
-            await ws.send_str(json.dumps({
-                'type': 'scan',
-                'data': data,
-            }))
+            await self._send_payload(ws, self._encode_scan(self.latest_scan))
 
         try:
             async for msg in ws:
                 if msg.type == aiohttp.WSMsgType.TEXT:
                     # Handle client commands
                     try:
-                        command = json.loads(msg.data)
-                        await self._handle_client_command(ws, command)
-                    except json.JSONDecodeError:
-                        pass
+                        command = json_loads(msg.data)
+                    except ValueError:  # json and orjson decode errors
+                        continue
+                    await self._handle_client_command(ws, command)
                 elif msg.type == aiohttp.WSMsgType.ERROR:
                     logger.error(f"WebSocket error: {ws.exception()}")
 
         finally:
-            self.ws_clients.discard(ws)
+            self._remove_client(ws)
             logger.info(f"WebSocket client disconnected: {client_ip} "
                         f"(remaining: {len(self.ws_clients)})")
 
         return ws
 
+    def _remove_client(self, ws: web.WebSocketResponse) -> None:
+        """Remove a WebSocket client (no-op if already removed)"""
+        if ws in self.ws_clients:
+            self.ws_clients = tuple(c for c in self.ws_clients if c is not ws)
+        self._ws_late.pop(ws, None)
+        self._ws_skipped.pop(ws, None)
+
     async def _handle_client_command(self, ws: web.WebSocketResponse, command: dict) -> None:
         """Handle commands from WebSocket clients"""
         cmd_type = command.get('type')
 
         if cmd_type == 'ping':
-            await ws.send_str(json.dumps({'type': 'pong', 'timestamp': time.time()}))
+            await ws.send_str(json_text({'type': 'pong', 'timestamp': time.time()}))
 
         elif cmd_type == 'get_status':
             status = self._get_status()
-            await ws.send_str(json.dumps({'type': 'status', 'data': status}))
+            await ws.send_str(json_text({'type': 'status', 'data': status}))
 
         elif cmd_type == 'set_compact_mode':
             self.config.compact_mode = command.get('value', True)
-            await ws.send_str(json.dumps({'type': 'ack', 'command': 'set_compact_mode'}))
+            await ws.send_str(ACK_SET_COMPACT_MODE)
 
     async def _handle_status(self, request: web.Request) -> web.Response:
         """Handle status API request"""
         status = self._get_status()
-        return web.json_response(status)
+        return json_response(status)
 
     async def _handle_config(self, request: web.Request) -> web.Response:
         """Handle config GET request"""
@@ -515,7 +689,7 @@ class LidarVisualizationApp:
             'sensor_ip': self.config.sensor_ip,
             'compact_mode': self.config.compact_mode,
         }
-        return web.json_response(config)
+        return json_response(config)
 
     async def _handle_set_config(self, request: web.Request) -> web.Response:
         """Handle config POST request"""
@@ -525,17 +699,17 @@ class LidarVisualizationApp:
             if 'compact_mode' in data:
                 self.config.compact_mode = bool(data['compact_mode'])
 
-            return web.json_response({'status': 'ok'})
+            return json_response({'status': 'ok'})
 
         except Exception as e:
-            return web.json_response({'error': str(e)}, status=400)
+            return json_response({'error': str(e)}, status=400)
 
     # Product/Zone API handlers
     async def _handle_get_products(self, request: web.Request) -> web.Response:
         """Get all product configurations"""
         products = self.evaluator.list_products()
         active_id = self.evaluator.active_product_id
-        return web.json_response({
+        return json_response({
             'products': products,
             'active_product_id': active_id,
         })
@@ -552,12 +726,12 @@ class LidarVisualizationApp:
                 product.id = max(existing_ids, default=0) + 1
 
             self.evaluator.add_product(product)
-            return web.json_response({
+            return json_response({
                 'status': 'ok',
                 'product': product.to_dict()
             })
         except Exception as e:
-            return web.json_response({'error': str(e)}, status=400)
+            return json_response({'error': str(e)}, status=400)
 
     async def _handle_get_product(self, request: web.Request) -> web.Response:
         """Get a specific product configuration"""
@@ -565,10 +739,10 @@ class LidarVisualizationApp:
             product_id = int(request.match_info['id'])
             product = self.evaluator.get_product(product_id)
             if product:
-                return web.json_response(product.to_dict())
-            return web.json_response({'error': 'Product not found'}, status=404)
+                return json_response(product.to_dict())
+            return json_response({'error': 'Product not found'}, status=404)
         except ValueError:
-            return web.json_response({'error': 'Invalid product ID'}, status=400)
+            return json_response({'error': 'Invalid product ID'}, status=400)
 
     async def _handle_update_product(self, request: web.Request) -> web.Response:
         """Update a product configuration"""
@@ -580,53 +754,53 @@ class LidarVisualizationApp:
             product = ProductConfig.from_dict(data)
             self.evaluator.add_product(product)
 
-            return web.json_response({
+            return json_response({
                 'status': 'ok',
                 'product': product.to_dict()
             })
         except Exception as e:
-            return web.json_response({'error': str(e)}, status=400)
+            return json_response({'error': str(e)}, status=400)
 
     async def _handle_delete_product(self, request: web.Request) -> web.Response:
         """Delete a product configuration"""
         try:
             product_id = int(request.match_info['id'])
             if self.evaluator.remove_product(product_id):
-                return web.json_response({'status': 'ok'})
-            return web.json_response({'error': 'Product not found'}, status=404)
+                return json_response({'status': 'ok'})
+            return json_response({'error': 'Product not found'}, status=404)
         except ValueError:
-            return web.json_response({'error': 'Invalid product ID'}, status=400)
+            return json_response({'error': 'Invalid product ID'}, status=400)
 
     async def _handle_activate_product(self, request: web.Request) -> web.Response:
         """Set a product as the active product for evaluation"""
         try:
             product_id = int(request.match_info['id'])
             if self.evaluator.set_active_product(product_id):
-                return web.json_response({'status': 'ok', 'active_product_id': product_id})
-            return web.json_response({'error': 'Product not found'}, status=404)
+                return json_response({'status': 'ok', 'active_product_id': product_id})
+            return json_response({'error': 'Product not found'}, status=404)
         except ValueError:
-            return web.json_response({'error': 'Invalid product ID'}, status=400)
+            return json_response({'error': 'Invalid product ID'}, status=400)
 
     async def _handle_get_measurements(self, request: web.Request) -> web.Response:
         """Get latest measurement results"""
         if self.latest_result:
-            return web.json_response({
+            return json_response({
                 'result': self.latest_result.to_dict(),
                 'statistics': self.evaluator.get_statistics(),
             })
-        return web.json_response({
+        return json_response({
             'result': None,
             'statistics': self.evaluator.get_statistics(),
         })
 
     async def _handle_get_statistics(self, request: web.Request) -> web.Response:
         """Get evaluation statistics"""
-        return web.json_response(self.evaluator.get_statistics())
+        return json_response(self.evaluator.get_statistics())
 
     async def _handle_reset_statistics(self, request: web.Request) -> web.Response:
         """Reset evaluation statistics"""
         self.evaluator.reset_statistics()
-        return web.json_response({'status': 'ok'})
+        return json_response({'status': 'ok'})
 
     def _get_status(self) -> dict:
         """Get current application status"""
@@ -637,6 +811,7 @@ class LidarVisualizationApp:
             'uptime_seconds': round(uptime, 1),
             'scans_received': self.stats['scans_received'],
             'scans_sent': self.stats['scans_sent'],
+            'scans_dropped': self.stats['scans_dropped'],
             'ws_clients': len(self.ws_clients),
             'ws_messages_sent': self.stats['ws_messages_sent'],
         }
@@ -665,6 +840,12 @@ async def main():
                         help='Run in simulation mode (no real sensor)')
     parser.add_argument('--sim-rate', type=float, default=12.5,
                         help='Simulation scan rate in Hz (default: 12.5)')
+    parser.add_argument('--json-scans', action='store_true',
+                        help='Send compact scans as JSON instead of binary frames')
+    parser.add_argument('--skip-idle-evaluation', action='store_true',
+                        help='Skip evaluation while no WebSocket client or PLC server is attached')
+    parser.add_argument('--short-circuit-on-bad', action='store_true',
+                        help='Stop evaluating zones after the first BAD one (later zones report STALE)')
     parser.add_argument('--static', type=str, default='../frontend',
                         help='Path to static files')
     parser.add_argument('--config', type=str, default='../config/products.json',
@@ -693,6 +874,9 @@ async def main():
         sensor_ip=args.sensor_ip,
         simulation_mode=args.simulate,
         simulation_rate=args.sim_rate,
+        binary_mode=not args.json_scans,
+        skip_idle_evaluation=args.skip_idle_evaluation,
+        short_circuit_on_bad=args.short_circuit_on_bad,
         static_path=args.static,
         config_path=args.config,
         enable_opcua=not args.no_opcua,
@@ -707,7 +891,7 @@ async def main():
     app = LidarVisualizationApp(config)
 
     # Handle shutdown signals
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
 
     def shutdown_handler():
         logger.info("Shutdown signal received")
@@ -730,4 +914,10 @@ async def main():
 
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    # Use uvloop (libuv-based event loop) for faster socket I/O when available
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -26,6 +26,24 @@ from enum import IntEnum
 
 logger = logging.getLogger(__name__)
 
+# Pre-compiled wire formats (all EtherNet/IP fields are little-endian
+# except the socket address in ListIdentity, which is network order)
+_ENCAP_STRUCT = struct.Struct('<HH I I 8s I')          # Encapsulation header (24 bytes)
+_ENCAP_SESSION_CONTEXT = struct.Struct('<4x I 4x 8s')  # Session handle + sender context
+_REG_SESSION_RESP = struct.Struct('<HH I I 8s I HH')   # RegisterSession reply
+_IMPLICIT_HDR = struct.Struct('<HI')                   # Sequence count + connection ID
+_INPUT_HEAD = struct.Struct('<BBBB IIII')               # Input assembly bytes 0-19
+_INPUT_TAIL = struct.Struct('<III')                     # Input assembly bytes 52-63
+_UDINT = struct.Struct('<I')
+_ZONE_PAIR = struct.Struct('<II')                       # Zone measurement + result
+_OUTPUT_STRUCT = struct.Struct('<BBxx IIII 12x')
+_OUTPUT_HDR = struct.Struct('<BBxx IIII')              # Output assembly without padding
+_UINT16 = struct.Struct('<H')
+_IDENTITY_HDR = struct.Struct('<HHH')                  # CPF item count, item type ID, item length
+_SOCKADDR = struct.Struct('>hHI8x')                    # sin_family, sin_port, sin_addr, sin_zero
+_IDENTITY_BODY = struct.Struct('<HHH BB H I B')        # Vendor .. product name length
+_SERVICES_ITEM = struct.Struct('<HH HH 16s')
+
 
 class CIPService(IntEnum):
     """CIP Service Codes"""
@@ -66,7 +84,25 @@ class EIPCommand(IntEnum):
     SEND_UNIT_DATA = 0x0070
 
 
-@dataclass
+# Plain int command codes for per-frame dispatch
+_CMD_LIST_SERVICES = EIPCommand.LIST_SERVICES.value
+_CMD_LIST_IDENTITY = EIPCommand.LIST_IDENTITY.value
+_CMD_REGISTER_SESSION = EIPCommand.REGISTER_SESSION.value
+_CMD_UNREGISTER_SESSION = EIPCommand.UNREGISTER_SESSION.value
+_CMD_SEND_RR_DATA = EIPCommand.SEND_RR_DATA.value
+_CMD_SEND_UNIT_DATA = EIPCommand.SEND_UNIT_DATA.value
+
+# RegisterSession reply with everything but session handle and sender context
+# filled in: command(2) + length(2) + session(4) + status(4) + context(8) +
+# options(4) + protocol version(2) + options flags(2)
+_REG_SESSION_TEMPLATE = _REG_SESSION_RESP.pack(
+    EIPCommand.REGISTER_SESSION, 4,
+    0, 0, bytes(8), 0,
+    1, 0  # Protocol version 1, no options
+)
+
+
+@dataclass(slots=True)
 class AssemblyInstance:
     """Assembly Instance for I/O data"""
     instance_id: int
@@ -75,7 +111,7 @@ class AssemblyInstance:
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class CIPConnection:
     """Active CIP connection"""
     connection_id: int
@@ -85,9 +121,12 @@ class CIPConnection:
     rpi: int  # Request Packet Interval (microseconds)
     addr: tuple
     last_update: float = 0.0
+    # Reused implicit I/O reply: sequence count + connection ID + input assembly
+    response_buffer: bytearray = field(default_factory=lambda: bytearray(6 + 64))
+    response_version: int = -1   # Input data version held in response_buffer
 
 
-@dataclass
+@dataclass(slots=True)
 class LIDAROutputAssembly:
     """
     Output Assembly (PLC -> LIDAR) - 32 bytes
@@ -110,21 +149,22 @@ class LIDAROutputAssembly:
     zone2_tolerance: int = 0
 
     def to_bytes(self) -> bytes:
-        return struct.pack('<BBxx IIII 12x',
+        return _OUTPUT_STRUCT.pack(
             self.command, self.product_id,
             self.zone1_expected, self.zone1_tolerance,
             self.zone2_expected, self.zone2_tolerance
         )
 
     @classmethod
-    def from_bytes(cls, data: bytes) -> 'LIDAROutputAssembly':
-        if len(data) < 20:
-            data = data + b'\x00' * (20 - len(data))
-        cmd, prod, z1_exp, z1_tol, z2_exp, z2_tol = struct.unpack('<BBxx IIII', data[:20])
-        return cls(cmd, prod, z1_exp, z1_tol, z2_exp, z2_tol)
+    def from_bytes(cls, data: bytes, offset: int = 0) -> 'LIDAROutputAssembly':
+        if len(data) - offset < _OUTPUT_HDR.size:
+            # Short assembly: zero-fill the missing fields
+            data = bytes(data[offset:]).ljust(_OUTPUT_HDR.size, b'\x00')
+            offset = 0
+        return cls(*_OUTPUT_HDR.unpack_from(data, offset))
 
 
-@dataclass
+@dataclass(slots=True)
 class LIDARInputAssembly:
     """
     Input Assembly (LIDAR -> PLC) - 64 bytes
@@ -139,7 +179,7 @@ class LIDARInputAssembly:
     - Bytes 12-15: Bad count - DINT
     - Bytes 16-19: Good rate (x100, e.g., 9850 = 98.50%) - DINT
     - Bytes 20-23: Zone 1 measurement (mm) - DINT
-    - Bytes 24-27: Zone 1 result (0=Unknown, 1=Good, 2=Bad) - DINT
+    - Bytes 24-27: Zone 1 result (0=Unknown, 1=Good, 2=Bad, 3=NoTarget, 4=Error, 5=Stale) - DINT
     - Bytes 28-31: Zone 2 measurement (mm) - DINT
     - Bytes 32-35: Zone 2 result - DINT
     - Bytes 36-39: Zone 3 measurement (mm) - DINT
@@ -158,20 +198,40 @@ class LIDARInputAssembly:
     good_count: int = 0
     bad_count: int = 0
     good_rate: int = 0
-    zone_measurements: List[int] = field(default_factory=lambda: [0, 0, 0, 0])
-    zone_results: List[int] = field(default_factory=lambda: [0, 0, 0, 0])
+    zone_data: bytearray = field(default_factory=lambda: bytearray(32))  # Bytes 20-51, packed
     timestamp: int = 0
     min_distance: int = 0
     max_distance: int = 0
 
+    def set_zone_measurement(self, zone: int, measurement: int) -> None:
+        """Set the measurement (mm) of zone 0-3"""
+        _UDINT.pack_into(self.zone_data, zone * 8, measurement)
+
+    def set_zone_result(self, zone: int, result: int) -> None:
+        """Set the result of zone 0-3"""
+        _UDINT.pack_into(self.zone_data, zone * 8 + 4, result)
+
+    @property
+    def zone_measurements(self) -> List[int]:
+        return [_UDINT.unpack_from(self.zone_data, i * 8)[0] for i in range(4)]
+
+    @property
+    def zone_results(self) -> List[int]:
+        return [_UDINT.unpack_from(self.zone_data, i * 8 + 4)[0] for i in range(4)]
+
     def to_bytes(self) -> bytes:
-        return struct.pack('<BBBB IIII IIIIIIII III',
+        buffer = bytearray(64)
+        self.pack_into(buffer)
+        return bytes(buffer)
+
+    def pack_into(self, buffer: bytearray, offset: int = 0) -> None:
+        """Write the 64-byte assembly into an existing buffer"""
+        _INPUT_HEAD.pack_into(buffer, offset,
             self.status, self.product_id, self.overall_result, self.zone_count,
-            self.scan_counter, self.good_count, self.bad_count, self.good_rate,
-            self.zone_measurements[0], self.zone_results[0],
-            self.zone_measurements[1], self.zone_results[1],
-            self.zone_measurements[2], self.zone_results[2],
-            self.zone_measurements[3], self.zone_results[3],
+            self.scan_counter, self.good_count, self.bad_count, self.good_rate
+        )
+        buffer[offset + 20:offset + 52] = self.zone_data
+        _INPUT_TAIL.pack_into(buffer, offset + 52,
             self.timestamp, self.min_distance, self.max_distance
         )
 
@@ -191,22 +251,31 @@ class EtherNetIPServer:
     REVISION = (1, 0)
     SERIAL_NUMBER = 0x12345678
     PRODUCT_NAME = "MRS1000 LIDAR Sensor"
+    PRODUCT_NAME_BYTES = PRODUCT_NAME.encode('utf-8')
+
+    # Table sizes (powers of two); handles index their table by handle & (size - 1)
+    MAX_SESSIONS = 32
+    MAX_CONNECTIONS = 64
 
     def __init__(self, host: str = "0.0.0.0", tcp_port: int = 44818, udp_port: int = 2222):
         self.host = host
         self.tcp_port = tcp_port
         self.udp_port = udp_port
 
+        # ListIdentity reply data never changes, so build it once
+        self._list_identity_cpf = self._build_list_identity_cpf()
+
         # Session management
-        self._sessions: Dict[int, tuple] = {}
+        self._sessions: List[int] = [0] * self.MAX_SESSIONS  # Session handle per slot, 0 = free
         self._session_counter = 1
 
         # Connection management
-        self._connections: Dict[int, CIPConnection] = {}
+        self._connections: List[Optional[CIPConnection]] = [None] * self.MAX_CONNECTIONS
         self._connection_counter = 1
 
         # Assembly instances
         self._input_assembly = LIDARInputAssembly()
+        self._input_version = 0  # Bumped on every input assembly update
         self._output_assembly = LIDAROutputAssembly()
 
         # I/O Assembly instances (100=Input, 101=Output, 102=Config)
@@ -216,6 +285,16 @@ class EtherNetIPServer:
             102: AssemblyInstance(102, 16, bytearray(16), "Configuration Assembly"),
         }
 
+        # Encapsulation command handlers, all called as handler(session, context, data)
+        self._encap_dispatch: Dict[int, Callable[[int, bytes, memoryview], Optional[bytes]]] = {
+            _CMD_REGISTER_SESSION: self._handle_register_session,
+            _CMD_UNREGISTER_SESSION: self._handle_unregister_session,
+            _CMD_LIST_IDENTITY: self._handle_list_identity,
+            _CMD_LIST_SERVICES: self._handle_list_services,
+            _CMD_SEND_RR_DATA: self._handle_send_rr_data,
+            _CMD_SEND_UNIT_DATA: self._handle_send_unit_data,
+        }
+
         # Callbacks
         self._on_output_received: Optional[Callable[[LIDAROutputAssembly], None]] = None
 
@@ -223,7 +302,7 @@ class EtherNetIPServer:
         self._tcp_server = None
         self._udp_transport = None
         self._running = False
-        self._start_time = time.time()
+        self._start_ns = time.monotonic_ns()
 
     def set_output_callback(self, callback: Callable[[LIDAROutputAssembly], None]):
         """Set callback for when output data is received from PLC"""
@@ -243,43 +322,71 @@ class EtherNetIPServer:
                           min_distance: int = None,
                           max_distance: int = None):
         """Update the input assembly data to send to PLC"""
-        if status is not None:
-            self._input_assembly.status = status
-        if product_id is not None:
-            self._input_assembly.product_id = product_id
-        if overall_result is not None:
-            self._input_assembly.overall_result = overall_result
-        if zone_count is not None:
-            self._input_assembly.zone_count = zone_count
-        if scan_counter is not None:
-            self._input_assembly.scan_counter = scan_counter
-        if good_count is not None:
-            self._input_assembly.good_count = good_count
-        if bad_count is not None:
-            self._input_assembly.bad_count = bad_count
+        asm = self._input_assembly
+        for name, value in (('status', status), ('product_id', product_id),
+                            ('overall_result', overall_result),
+                            ('zone_count', zone_count),
+                            ('scan_counter', scan_counter),
+                            ('good_count', good_count), ('bad_count', bad_count),
+                            ('min_distance', min_distance),
+                            ('max_distance', max_distance)):
+            if value is not None:
+                setattr(asm, name, value)
         if good_rate is not None:
-            self._input_assembly.good_rate = int(good_rate * 100)
+            asm.good_rate = int(good_rate * 100)
         if zone_measurements is not None:
             for i, m in enumerate(zone_measurements[:4]):
-                self._input_assembly.zone_measurements[i] = m
+                asm.set_zone_measurement(i, m)
         if zone_results is not None:
             for i, r in enumerate(zone_results[:4]):
-                self._input_assembly.zone_results[i] = r
-        if min_distance is not None:
-            self._input_assembly.min_distance = min_distance
-        if max_distance is not None:
-            self._input_assembly.max_distance = max_distance
+                asm.set_zone_result(i, r)
 
         # Update timestamp
-        self._input_assembly.timestamp = int((time.time() - self._start_time) * 1000) & 0xFFFFFFFF
-
-        # Update assembly data
-        self._assemblies[100].data = bytearray(self._input_assembly.to_bytes())
+        asm.timestamp = ((time.monotonic_ns() - self._start_ns) // 1_000_000) & 0xFFFFFFFF
+
+        # Update assembly data in place
+        asm.pack_into(self._assemblies[100].data)
+        self._input_version += 1
+
+    def update_scan_data(self, status: int, product_id: int, overall_result: int,
+                         zone_count: int, scan_counter: int, good_count: int,
+                         bad_count: int, good_rate: float,
+                         zone_measurements: List[int], zone_results: List[int],
+                         min_distance: int, max_distance: int):
+        """
+        Replace all input assembly data at once (per-scan fast path)
+
+        Unlike update_input_data every value is required. Zones beyond the
+        given lists are cleared.
+        """
+        asm = self._input_assembly
+        asm.status = status
+        asm.product_id = product_id
+        asm.overall_result = overall_result
+        asm.zone_count = zone_count
+        asm.scan_counter = scan_counter
+        asm.good_count = good_count
+        asm.bad_count = bad_count
+        asm.good_rate = int(good_rate * 100)
+        asm.min_distance = min_distance
+        asm.max_distance = max_distance
+
+        zone_data = asm.zone_data
+        n_measurements = len(zone_measurements)
+        n_results = len(zone_results)
+        for i in range(4):
+            _ZONE_PAIR.pack_into(zone_data, i * 8,
+                zone_measurements[i] if i < n_measurements else 0,
+                zone_results[i] if i < n_results else 0)
+
+        asm.timestamp = ((time.monotonic_ns() - self._start_ns) // 1_000_000) & 0xFFFFFFFF
+        asm.pack_into(self._assemblies[100].data)
+        self._input_version += 1
 
     async def start(self):
         """Start the EtherNet/IP server"""
         self._running = True
-        self._start_time = time.time()
+        self._start_ns = time.monotonic_ns()
 
         # Start TCP server for explicit messaging
         self._tcp_server = await asyncio.start_server(
@@ -289,7 +396,7 @@ class EtherNetIPServer:
         )
 
         # Start UDP server for implicit I/O
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         self._udp_transport, _ = await loop.create_datagram_endpoint(
             lambda: EIPUDPProtocol(self),
             local_addr=(self.host, self.udp_port)
@@ -317,16 +424,18 @@ class EtherNetIPServer:
 
         try:
             while self._running:
-                # Read encapsulation header (24 bytes)
-                header = await reader.read(24)
-                if not header or len(header) < 24:
-                    break
+                # Read encapsulation header (24 bytes) and the command data behind it
+                header = await reader.readexactly(_ENCAP_STRUCT.size)
+                length = _UINT16.unpack_from(header, 2)[0]
+                data = memoryview(await reader.readexactly(length))
 
-                response = self._process_encapsulation(header, reader, addr)
+                response = self._process_encapsulation(header, data, addr)
                 if response:
                     writer.write(response)
                     await writer.drain()
 
+        except asyncio.IncompleteReadError:
+            pass  # Client closed the connection
         except asyncio.CancelledError:
             pass
         except Exception as e:
@@ -335,87 +444,79 @@ class EtherNetIPServer:
             writer.close()
             await writer.wait_closed()
 
-    def _process_encapsulation(self, header: bytes, reader: asyncio.StreamReader, addr: tuple) -> bytes:
-        """Process EtherNet/IP encapsulation header"""
-        command, length, session, status, context, options = struct.unpack('<HH I I 8s I', header)
-
-        if command == EIPCommand.REGISTER_SESSION:
-            return self._handle_register_session(context)
-        elif command == EIPCommand.UNREGISTER_SESSION:
-            return self._handle_unregister_session(session)
-        elif command == EIPCommand.LIST_IDENTITY:
-            return self._handle_list_identity(context)
-        elif command == EIPCommand.LIST_SERVICES:
-            return self._handle_list_services(context)
-        elif command == EIPCommand.SEND_RR_DATA:
-            return self._handle_send_rr_data(session, context, reader)
-        elif command == EIPCommand.SEND_UNIT_DATA:
-            return self._handle_send_unit_data(session, context, reader)
-        else:
+    def _process_encapsulation(self, header: bytes, data: memoryview, addr: tuple) -> bytes:
+        """Process an EtherNet/IP encapsulation header and its command data"""
+        # Dispatch on the command word; status and options are never used
+        command = int.from_bytes(header[0:2], 'little')
+        handler = self._encap_dispatch.get(command)
+        if handler is None:
             logger.warning(f"Unknown EIP command: 0x{command:04X}")
             return None
 
-    def _handle_register_session(self, context: bytes) -> bytes:
+        session, context = _ENCAP_SESSION_CONTEXT.unpack_from(header, 0)
+        return handler(session, context, data)
+
+    def _handle_register_session(self, session: int, context: bytes, data: memoryview) -> bytes:
         """Handle RegisterSession request"""
-        session = self._session_counter
-        self._session_counter += 1
-        self._sessions[session] = (time.time(),)
-
-        # Response: command(2) + length(2) + session(4) + status(4) + context(8) + options(4)
-        # + protocol version(2) + options flags(2)
-        response = struct.pack('<HH I I 8s I HH',
-            EIPCommand.REGISTER_SESSION, 4,
-            session, 0, context, 0,
-            1, 0  # Protocol version 1, no options
-        )
+        session = self._next_handle(self._sessions, self._session_counter)
+        self._session_counter = session + 1
+        self._sessions[session & (self.MAX_SESSIONS - 1)] = session
+
+        # Patch session handle and sender context into the prebuilt reply
+        response = bytearray(_REG_SESSION_TEMPLATE)
+        _UDINT.pack_into(response, 4, session)
+        response[12:20] = context
         logger.info(f"EIP session registered: {session}")
-        return response
+        return bytes(response)
 
-    def _handle_unregister_session(self, session: int) -> bytes:
+    def _handle_unregister_session(self, session: int, context: bytes, data: memoryview) -> bytes:
         """Handle UnregisterSession request"""
-        if session in self._sessions:
-            del self._sessions[session]
+        slot = session & (self.MAX_SESSIONS - 1)
+        if session and self._sessions[slot] == session:
+            self._sessions[slot] = 0
             logger.info(f"EIP session unregistered: {session}")
         return None  # No response for unregister
 
-    def _handle_list_identity(self, context: bytes) -> bytes:
-        """Handle ListIdentity request"""
-        # Build identity item
-        identity = struct.pack('<HH HH HH HH I H B',
-            0x0C,  # Type ID: List Identity Response
-            0,     # Length (filled later)
-            1,     # Encapsulation version
-            socket.htons(self.tcp_port) if hasattr(socket, 'htons') else self.tcp_port,
-            0, 0,  # Socket address (will be filled by client)
-            self.VENDOR_ID,
-            self.DEVICE_TYPE,
-            self.PRODUCT_CODE,
-            (self.REVISION[0] << 8) | self.REVISION[1],
-            0,     # Status
-            self.SERIAL_NUMBER,
-            len(self.PRODUCT_NAME)
+    def _build_list_identity_cpf(self) -> bytes:
+        """Build the ListIdentity reply data (CPF with one identity item)"""
+        name = self.PRODUCT_NAME_BYTES
+
+        # Item data: everything after type ID and length
+        item = (
+            _UINT16.pack(1)  # Encapsulation version
+            + _SOCKADDR.pack(socket.AF_INET, self.tcp_port, 0)  # IP filled by client
+            + _IDENTITY_BODY.pack(
+                self.VENDOR_ID,
+                self.DEVICE_TYPE,
+                self.PRODUCT_CODE,
+                self.REVISION[0], self.REVISION[1],
+                0,     # Status
+                self.SERIAL_NUMBER,
+                len(name)
+            )
+            + name
+            + b'\x00'  # State
         )
-        identity += self.PRODUCT_NAME.encode('utf-8')
-        identity += b'\x00'  # State
 
-        # Update length
-        identity = identity[:2] + struct.pack('<H', len(identity) - 4) + identity[4:]
-
-        # Build CPF (Common Packet Format)
-        cpf = struct.pack('<HH', 1, 0) + identity  # Item count = 1
+        # CPF (Common Packet Format): item count = 1, then the identity item
+        return _IDENTITY_HDR.pack(
+            1,
+            0x0C,  # Type ID: List Identity Response
+            len(item),
+        ) + item
 
-        # Build response
-        response = struct.pack('<HH I I 8s I',
-            EIPCommand.LIST_IDENTITY, len(cpf),
+    def _handle_list_identity(self, session: int, context: bytes, data: memoryview) -> bytes:
+        """Handle ListIdentity request"""
+        cpf = self._list_identity_cpf
+        return _ENCAP_STRUCT.pack(
+            _CMD_LIST_IDENTITY, len(cpf),
             0, 0, context, 0
         ) + cpf
 
-        return response
-
-    def _handle_list_services(self, context: bytes) -> bytes:
+    def _handle_list_services(self, session: int, context: bytes, data: memoryview) -> bytes:
         """Handle ListServices request"""
         # Services item
-        services = struct.pack('<HH HH 16s',
+        services = _SERVICES_ITEM.pack(
             0x0100,  # Type ID: Communications
             20,      # Length
             0x0120,  # Capability flags (supports TCP & UDP)
@@ -424,63 +525,71 @@ class EtherNetIPServer:
         )
 
         # CPF
-        cpf = struct.pack('<H', 1) + services
+        cpf = _UINT16.pack(1) + services
 
         # Response
-        response = struct.pack('<HH I I 8s I',
+        response = _ENCAP_STRUCT.pack(
             EIPCommand.LIST_SERVICES, len(cpf),
             0, 0, context, 0
         ) + cpf
 
         return response
 
-    def _handle_send_rr_data(self, session: int, context: bytes, reader) -> bytes:
+    def _handle_send_rr_data(self, session: int, context: bytes, data: memoryview) -> bytes:
         """Handle SendRRData (explicit messaging)"""
         # This would handle CIP explicit messages
         # For now, return a basic response
         return None
 
-    def _handle_send_unit_data(self, session: int, context: bytes, reader) -> bytes:
+    def _handle_send_unit_data(self, session: int, context: bytes, data: memoryview) -> bytes:
         """Handle SendUnitData (connected messaging)"""
         return None
 
-    def handle_implicit_io(self, data: bytes, addr: tuple) -> bytes:
+    def handle_implicit_io(self, data: bytes, addr: tuple) -> Optional[memoryview]:
         """Handle implicit I/O message (UDP)"""
         if len(data) < 6:
             return None
 
         # Parse sequence count and connection ID
-        seq_count, conn_id = struct.unpack('<HI', data[:6])
+        seq_count, conn_id = _IMPLICIT_HDR.unpack_from(data, 0)
 
         # Check if this is a valid connection
-        if conn_id not in self._connections:
+        conn = self._connections[conn_id & (self.MAX_CONNECTIONS - 1)]
+        if conn is None or conn.connection_id != conn_id:
             return None
 
-        conn = self._connections[conn_id]
         conn.last_update = time.time()
 
         # Process output data from PLC
         if len(data) > 6:
-            output_data = data[6:]
-            self._output_assembly = LIDAROutputAssembly.from_bytes(output_data)
-            self._assemblies[101].data = bytearray(output_data)
+            self._output_assembly = LIDAROutputAssembly.from_bytes(data, 6)
+            self._assemblies[101].data = bytearray(memoryview(data)[6:])
 
             if self._on_output_received:
                 self._on_output_received(self._output_assembly)
 
         # Send input data to PLC
-        input_data = self._assemblies[100].data
-        response = struct.pack('<HI', seq_count, conn.connection_id) + bytes(input_data)
+        return self._build_io_response(conn, seq_count)
 
-        return response
+    def _build_io_response(self, conn: CIPConnection, seq_count: int) -> memoryview:
+        """Fill the connection's reply buffer (overwriting the previous reply)"""
+        response = conn.response_buffer
+        _IMPLICIT_HDR.pack_into(response, 0, seq_count, conn.connection_id)
+
+        # Only copy the input assembly when it changed since this connection's last reply
+        if conn.response_version != self._input_version:
+            response[6:] = self._assemblies[100].data
+            conn.response_version = self._input_version
+
+        return memoryview(response)
 
     def create_connection(self, addr: tuple, input_assembly: int = 100,
                          output_assembly: int = 101, rpi: int = 10000) -> int:
         """Create a new I/O connection"""
-        conn_id = self._connection_counter
-        self._connection_counter += 1
+        conn_id = self._next_handle(self._connections, self._connection_counter)
+        self._connection_counter = conn_id + 1
 
-        self._connections[conn_id] = CIPConnection(
+        self._connections[conn_id & (self.MAX_CONNECTIONS - 1)] = CIPConnection(
             connection_id=conn_id,
             originator_serial=0,
             input_assembly=input_assembly,
@@ -493,6 +602,20 @@ class EtherNetIPServer:
         logger.info(f"Created EIP I/O connection {conn_id} to {addr}")
         return conn_id
 
+    @staticmethod
+    def _next_handle(table: list, start: int) -> int:
+        """
+        Return the first handle >= start whose slot in table is free
+
+        If the table is full the oldest entry's slot is reused.
+        """
+        mask = len(table) - 1
+        for handle in range(start, start + len(table)):
+            if not table[handle & mask]:
+                return handle
+        logger.warning("EIP handle table full, replacing oldest entry")
+        return start
+
 
 class EIPUDPProtocol(asyncio.DatagramProtocol):
     """UDP Protocol handler for implicit I/O"""
@@ -555,21 +678,13 @@ class EtherNetIPServerWrapper:
                                 zone_results: List[int],
                                 min_distance: int = 0,
                                 max_distance: int = 64000):
-        """Update measurement data for PLC"""
+        """Update measurement data for PLC (good_rate in percent)"""
         if self._server:
-            self._server.update_input_data(
-                status=status,
-                product_id=product_id,
-                overall_result=overall_result,
-                zone_count=zone_count,
-                scan_counter=scan_counter,
-                good_count=good_count,
-                bad_count=bad_count,
-                good_rate=good_rate,
-                zone_measurements=zone_measurements,
-                zone_results=zone_results,
-                min_distance=min_distance,
-                max_distance=max_distance
+            self._server.update_scan_data(
+                status, product_id, overall_result, zone_count,
+                scan_counter, good_count, bad_count, good_rate,
+                zone_measurements, zone_results,
+                min_distance, max_distance
             )
 
     def set_output_callback(self, callback: Callable[[LIDAROutputAssembly], None]):
@@ -0,0 +1,36 @@
+"""
+JSON encoding helpers
+
+Shared by the web application and the scan frame encoder so every JSON
+message goes through the same encoder (orjson when available).
+"""
+
+import json
+
+# Try to import orjson for faster JSON encoding
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def json_bytes(obj) -> bytes:
+    """Encode an object as UTF-8 JSON bytes (orjson when available)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def json_text(obj) -> str:
+    """Encode an object as JSON text for WebSocket text frames"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, separators=(',', ':'))
+
+
+def json_loads(data):
+    """Decode JSON text or bytes (orjson when available)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
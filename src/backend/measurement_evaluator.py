@@ -9,16 +9,33 @@ Used with:
 - Rockwell Studio 5000 (via Modbus TCP / EtherNet/IP)
 """
 
+import atexit
 import json
-import math
+import os
+import queue
 import time
 import threading
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Tuple, Callable
 from enum import IntEnum
 from pathlib import Path
+from operator import attrgetter
 import logging
 
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,9 +46,84 @@ class MeasurementResult(IntEnum):
     BAD = 2
     NO_TARGET = 3  # No object detected in zone
     ERROR = 4
+    STALE = 5      # Not evaluated this scan (short-circuited after a BAD zone)
+
+
+_LAYER_BIT = np.uint16(1)
+
+_RESULT_NAMES = {int(r): r.name for r in MeasurementResult}
 
 
-@dataclass
+def _copy_slots(obj):
+    """Shallow-copy a slots dataclass, bypassing __init__ and __setattr__"""
+    cls = type(obj)
+    copy = object.__new__(cls)
+    for name in cls.__slots__:
+        object.__setattr__(copy, name, getattr(obj, name))
+    return copy
+
+
+# Result codes as plain ints for the zone kernel (compile-time constants under Numba)
+_GOOD = int(MeasurementResult.GOOD)
+_BAD = int(MeasurementResult.BAD)
+_NO_TARGET = int(MeasurementResult.NO_TARGET)
+
+
+def _zone_kernel(distances: np.ndarray, expected: float, tolerance_plus: float,
+                 tolerance_minus: float, min_points: int, use_median: bool,
+                 outlier_rejection: bool, std_factor: float) -> Tuple[int, float]:
+    """
+    Evaluate the distances of one zone
+
+    Outliers are rejected by median absolute deviation (MAD): scaled by
+    1.4826 it estimates the standard deviation of normally distributed
+    data, so std_factor keeps its meaning, but unlike mean/std the centre
+    and spread are not dragged along by the outliers themselves. The
+    median uses selection (np.partition) rather than a full sort.
+
+    Written against the subset of NumPy that Numba supports, and compiled
+    with @njit when Numba is installed.
+
+    Returns:
+        Tuple of (result code, measured_distance)
+    """
+    n = distances.size
+    if n == 0 or n < min_points:
+        return _NO_TARGET, 0.0
+
+    # Outlier rejection if enabled
+    if outlier_rejection and n > 3:
+        median = np.median(distances)
+        deviation = np.abs(distances - median)
+        mad = np.median(deviation)
+        if mad >= 1e-6:  # Otherwise essentially no variation
+            distances = distances[deviation <= std_factor * 1.4826 * mad]
+            n = distances.size
+            if n == 0 or n < min_points:
+                return _NO_TARGET, 0.0
+
+    # Calculate measurement
+    if use_median:
+        half = n // 2
+        part = np.partition(distances, half)
+        if n % 2 == 0:
+            measurement = (float(part[:half].max()) + float(part[half])) / 2
+        else:
+            measurement = float(part[half])
+    else:
+        measurement = float(distances.mean())
+
+    # Evaluate against expected distance
+    if expected - tolerance_minus <= measurement <= expected + tolerance_plus:
+        return _GOOD, measurement
+    return _BAD, measurement
+
+
+if NUMBA_AVAILABLE:
+    _zone_kernel = njit(cache=True, fastmath=True)(_zone_kernel)
+
+
+@dataclass(slots=True)
 class MeasurementZone:
     """
     Defines a measurement zone in the LIDAR field of view
@@ -63,7 +155,7 @@ class MeasurementZone:
     min_points: int = 5  # Minimum points required in zone for valid measurement
     use_median: bool = True  # Use median (True) or mean (False) for measurement
     outlier_rejection: bool = True  # Reject statistical outliers
-    outlier_std_factor: float = 2.0  # Reject points > N std deviations from mean
+    outlier_std_factor: float = 2.0  # Reject points > N std deviations (MAD-based) from median
 
     # Result
     last_measurement: float = 0.0
@@ -71,9 +163,42 @@ class MeasurementZone:
     last_update_time: float = 0.0
     point_count: int = 0
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary for serialization"""
-        return {
+    # Serialized form, reused until a public field is assigned
+    _dirty: bool = field(default=True, init=False, repr=False, compare=False)
+    _cached_dict: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+    _cached_fast: bool = field(default=False, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name[0] != '_':
+            object.__setattr__(self, '_dirty', True)
+
+    def filter_key(self) -> tuple:
+        """Fields that decide which points fall inside the zone"""
+        return (self.enabled, self.start_angle, self.end_angle,
+                self.min_valid_distance, self.max_valid_distance, tuple(self.layers))
+
+    def to_dict(self, fast: bool = False) -> dict:
+        """
+        Convert to dictionary for serialization
+
+        The dictionary is cached until a field is assigned again, so treat
+        it as read-only (and replace `layers` rather than mutating it).
+        Evaluation assigns the result fields on every scan, so the cache only
+        helps repeated reads between scans (REST/config requests), not the
+        per-scan measurement broadcast.
+
+        Args:
+            fast: Emit last_measurement unrounded, for consumers that
+                format the value themselves
+        """
+        if not self._dirty and self._cached_dict is not None and self._cached_fast == fast:
+            return self._cached_dict
+
+        # Clear the flag before reading the fields, so an assignment made
+        # while the dict is being built marks it dirty again
+        self._dirty = False
+        self._cached_dict = {
             'id': self.id,
             'name': self.name,
             'enabled': self.enabled,
@@ -89,12 +214,14 @@ class MeasurementZone:
             'use_median': self.use_median,
             'outlier_rejection': self.outlier_rejection,
             'outlier_std_factor': self.outlier_std_factor,
-            'last_measurement': round(self.last_measurement, 4),
+            'last_measurement': self.last_measurement if fast else round(self.last_measurement, 4),
             'last_result': self.last_result,
-            'last_result_name': MeasurementResult(self.last_result).name,
+            'last_result_name': _RESULT_NAMES[self.last_result],
             'last_update_time': self.last_update_time,
             'point_count': self.point_count,
         }
+        self._cached_fast = fast
+        return self._cached_dict
 
     @classmethod
     def from_dict(cls, data: dict) -> 'MeasurementZone':
@@ -118,7 +245,53 @@ class MeasurementZone:
         )
 
 
-@dataclass
+@dataclass(slots=True)
+class ZoneTable:
+    """
+    Enabled zones of a product as parallel arrays
+
+    Each array has shape (Z, 1) so it broadcasts against the (N,) scan
+    arrays, letting all zones be filtered in one pass instead of one pass
+    per zone. Overlapping zones need no special handling: every zone gets
+    its own row in the mask.
+    """
+    zones: List[MeasurementZone]
+    layer_masks: np.ndarray    # uint16 bitmask of selected layers
+    start_angles: np.ndarray
+    end_angles: np.ndarray
+    min_distances: np.ndarray
+    max_distances: np.ndarray
+
+    @classmethod
+    def from_zones(cls, zones: List[MeasurementZone]) -> 'ZoneTable':
+        """Build the table from the enabled zones"""
+        zones = [z for z in zones if z.enabled]
+
+        def column(values, dtype=np.float32):
+            return np.array(values, dtype=dtype).reshape(-1, 1)
+
+        return cls(
+            zones=zones,
+            layer_masks=column([sum(1 << layer for layer in set(z.layers) if 0 <= layer < 16)
+                                for z in zones], np.uint16),
+            start_angles=column([z.start_angle for z in zones]),
+            end_angles=column([z.end_angle for z in zones]),
+            min_distances=column([z.min_valid_distance for z in zones]),
+            max_distances=column([z.max_valid_distance for z in zones]),
+        )
+
+    def point_masks(self, layers: np.ndarray, angles: np.ndarray,
+                    distances: np.ndarray) -> np.ndarray:
+        """Get a (Z, N) boolean mask of the points inside each zone"""
+        mask = (_LAYER_BIT << layers) & self.layer_masks != 0
+        mask &= angles >= self.start_angles
+        mask &= angles <= self.end_angles
+        mask &= distances >= self.min_distances
+        mask &= distances <= self.max_distances
+        return mask
+
+
+@dataclass(slots=True)
 class ProductConfig:
     """
     Product configuration containing multiple measurement zones
@@ -133,18 +306,59 @@ class ProductConfig:
     last_result: MeasurementResult = MeasurementResult.UNKNOWN
     last_update_time: float = 0.0
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary for serialization"""
-        return {
+    # Zone table for the fused evaluation pass, rebuilt when a zone filter changes
+    _zone_table_key: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _zone_table: Optional[ZoneTable] = field(default=None, init=False, repr=False, compare=False)
+
+    # Serialized form, reused until a public field is assigned or a zone changes
+    _dirty: bool = field(default=True, init=False, repr=False, compare=False)
+    _cached_dict: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name[0] != '_':
+            object.__setattr__(self, '_dirty', True)
+
+    def zone_table(self) -> ZoneTable:
+        """Get the zone table, rebuilding it if zones were added, removed or edited"""
+        key = tuple((id(z), z.filter_key()) for z in self.zones)
+        if key != self._zone_table_key:
+            self._zone_table = ZoneTable.from_zones(self.zones)
+            self._zone_table_key = key
+        return self._zone_table
+
+    def snapshot(self) -> 'ProductConfig':
+        """Copy with its own zone objects, safe to read while evaluation continues"""
+        product = _copy_slots(self)
+        object.__setattr__(product, 'zones', [_copy_slots(z) for z in self.zones])
+        return product
+
+    def to_dict(self, fast: bool = False) -> dict:
+        """
+        Convert to dictionary for serialization
+
+        Cached like MeasurementZone.to_dict (treat as read-only). Results
+        change every scan, so the measurement broadcast rebuilds it each time.
+        """
+        zone_dicts = [z.to_dict(fast) for z in self.zones]
+        cached = self._cached_dict
+        if (not self._dirty and cached is not None
+                and len(cached['zones']) == len(zone_dicts)
+                and all(a is b for a, b in zip(cached['zones'], zone_dicts))):
+            return cached
+
+        self._dirty = False
+        self._cached_dict = {
             'id': self.id,
             'name': self.name,
             'description': self.description,
             'enabled': self.enabled,
-            'zones': [z.to_dict() for z in self.zones],
+            'zones': zone_dicts,
             'last_result': self.last_result,
-            'last_result_name': MeasurementResult(self.last_result).name,
+            'last_result_name': _RESULT_NAMES[self.last_result],
             'last_update_time': self.last_update_time,
         }
+        return self._cached_dict
 
     @classmethod
     def from_dict(cls, data: dict) -> 'ProductConfig':
@@ -170,27 +384,45 @@ class MeasurementEvaluator:
     - Persistent product configuration storage
     """
 
-    def __init__(self, config_path: Optional[str] = None):
+    # Seconds to wait after a save request so that bursts of edits coalesce
+    SAVE_DELAY = 0.25
+
+    def __init__(self, config_path: Optional[str] = None, short_circuit_on_bad: bool = False):
         """
         Initialize the measurement evaluator
 
         Args:
             config_path: Path to save/load product configurations
+            short_circuit_on_bad: Stop evaluating zones once one is not GOOD.
+                The overall result is the same; the skipped zones are
+                marked STALE and keep their previous measurement. Each scan
+                still counts as one evaluation in the statistics.
         """
         self.config_path = Path(config_path) if config_path else None
+        self.short_circuit_on_bad = short_circuit_on_bad
         self.products: Dict[int, ProductConfig] = {}
         self.active_product_id: Optional[int] = None
 
-        # Result callbacks
+        # Result callbacks, run on a background thread from a small
+        # drop-oldest queue so slow consumers never stall evaluation
         self._result_callbacks: List[Callable[[ProductConfig], None]] = []
+        self._callback_queue: queue.Queue = queue.Queue(maxsize=4)
+        self._callback_thread: Optional[threading.Thread] = None
 
         # Statistics
         self.evaluation_count = 0
         self.good_count = 0
         self.bad_count = 0
 
-        # Thread safety
+        # Thread safety: config changes publish the active product here under
+        # the lock, evaluate_scan only reads the reference
         self._lock = threading.Lock()
+        self._active_product: Optional[ProductConfig] = None
+
+        # Background config writer, coalesces bursts of edits into one write
+        self._save_event = threading.Event()
+        self._save_thread: Optional[threading.Thread] = None
+        self._write_lock = threading.Lock()
 
         # Load saved configuration
         if self.config_path and self.config_path.exists():
@@ -206,12 +438,43 @@ class MeasurementEvaluator:
             self._result_callbacks.remove(callback)
 
     def _notify_results(self, product: ProductConfig) -> None:
-        """Notify all registered callbacks of new results"""
-        for callback in self._result_callbacks:
+        """
+        Queue new results for the callback thread
+
+        Callbacks receive a snapshot of the product, so they can read it
+        (or hand it to another thread) while later scans are evaluated.
+        If the callbacks fall behind, the oldest queued result is dropped.
+        """
+        if not self._result_callbacks:
+            return
+
+        if self._callback_thread is None:
+            self._callback_thread = threading.Thread(
+                target=self._callback_loop, name="result-callbacks", daemon=True)
+            self._callback_thread.start()
+
+        snapshot = product.snapshot()
+        try:
+            self._callback_queue.put_nowait(snapshot)
+        except queue.Full:
             try:
-                callback(product)
-            except Exception as e:
-                logger.error(f"Result callback error: {e}")
+                self._callback_queue.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self._callback_queue.put_nowait(snapshot)
+            except queue.Full:
+                pass
+
+    def _callback_loop(self) -> None:
+        """Background thread: notify all registered callbacks of new results"""
+        while True:
+            product = self._callback_queue.get()
+            for callback in tuple(self._result_callbacks):
+                try:
+                    callback(product)
+                except Exception as e:
+                    logger.error(f"Result callback error: {e}")
 
     def add_product(self, product: ProductConfig) -> None:
         """Add or update a product configuration"""
@@ -219,7 +482,8 @@ class MeasurementEvaluator:
             self.products[product.id] = product
             if self.active_product_id is None:
                 self.active_product_id = product.id
-        self.save_config()
+            self._publish_active_product()
+        self.request_save()
 
     def remove_product(self, product_id: int) -> bool:
         """Remove a product configuration"""
@@ -228,9 +492,13 @@ class MeasurementEvaluator:
                 del self.products[product_id]
                 if self.active_product_id == product_id:
                     self.active_product_id = next(iter(self.products.keys()), None)
-                self.save_config()
-                return True
-        return False
+                self._publish_active_product()
+                removed = True
+            else:
+                removed = False
+        if removed:
+            self.request_save()
+        return removed
 
     def get_product(self, product_id: int) -> Optional[ProductConfig]:
         """Get a product configuration"""
@@ -244,11 +512,17 @@ class MeasurementEvaluator:
 
     def set_active_product(self, product_id: int) -> bool:
         """Set the active product for evaluation"""
-        if product_id in self.products:
-            self.active_product_id = product_id
-            return True
+        with self._lock:
+            if product_id in self.products:
+                self.active_product_id = product_id
+                self._publish_active_product()
+                return True
         return False
 
+    def _publish_active_product(self) -> None:
+        """Update the product evaluate_scan works on (call with the lock held)"""
+        self._active_product = self.get_active_product()
+
     def list_products(self) -> List[dict]:
         """List all product configurations"""
         return [p.to_dict() for p in self.products.values()]
@@ -263,32 +537,45 @@ class MeasurementEvaluator:
         Returns:
             ProductConfig with updated results, or None if no active product
         """
-        product = self.get_active_product()
+        product = self._active_product
         if not product or not product.enabled:
             return None
 
-        with self._lock:
-            all_good = True
-            current_time = time.time()
+        # Evaluate without the lock so config changes from the API or PLC
+        # threads never wait on a scan
+        layers, angles, distances = self._scan_arrays(scan_data)
+        table = product.zone_table()
+        point_masks = table.point_masks(layers, angles, distances)
+
+        all_good = True
+        zone_results = []
+        for zone, mask in zip(table.zones, point_masks):
+            if not all_good and self.short_circuit_on_bad:
+                zone_results.append((zone, MeasurementResult.STALE, None, None))
+                continue
+
+            # Extract points in this zone
+            zone_points = distances[mask]
 
-            for zone in product.zones:
-                if not zone.enabled:
-                    continue
+            # Evaluate the zone
+            result, measurement = self._evaluate_zone(zone, zone_points)
+            zone_results.append((zone, result, measurement, len(zone_points)))
 
-                # Extract points in this zone
-                zone_points = self._extract_zone_points(scan_data, zone)
-                zone.point_count = len(zone_points)
+            if result != MeasurementResult.GOOD:
+                all_good = False
 
-                # Evaluate the zone
-                result, measurement = self._evaluate_zone(zone, zone_points)
+        # Publish the results together
+        with self._lock:
+            current_time = time.time()
 
+            for zone, result, measurement, point_count in zone_results:
                 zone.last_result = result
+                if measurement is None:
+                    continue  # Skipped: keeps its last measurement and time
+                zone.point_count = point_count
                 zone.last_measurement = measurement
                 zone.last_update_time = current_time
 
-                if result != MeasurementResult.GOOD:
-                    all_good = False
-
             # Update product overall result
             product.last_result = MeasurementResult.GOOD if all_good else MeasurementResult.BAD
             product.last_update_time = current_time
@@ -305,97 +592,102 @@ class MeasurementEvaluator:
 
         return product
 
-    def _extract_zone_points(self, scan_data, zone: MeasurementZone) -> List[float]:
-        """Extract distance measurements from points within the zone"""
-        distances = []
-
-        for point in scan_data.points:
-            # Check layer
-            if point.layer not in zone.layers:
-                continue
-
-            # Check angular bounds
-            angle = point.angle_h if hasattr(point, 'angle_h') else point.get('angle_h', point.get('angle', 0))
-            if angle < zone.start_angle or angle > zone.end_angle:
-                continue
-
-            # Get distance
-            distance = point.distance if hasattr(point, 'distance') else point.get('distance', 0)
-
-            # Check distance validity
-            if distance < zone.min_valid_distance or distance > zone.max_valid_distance:
-                continue
+    @staticmethod
+    def _scan_arrays(scan_data) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get (layers, angles, distances) arrays for a scan
 
-            distances.append(distance)
+        ScanData already stores its points as arrays. Anything else exposing
+        only a point list (ScanPoint objects or dicts) is converted once per
+        scan, not once per zone.
+        """
+        distances = getattr(scan_data, 'distances', None)
+        if isinstance(distances, np.ndarray):
+            return scan_data.layers, scan_data.angles, distances
+
+        # Points within a scan share one type, so pick the accessors once
+        points = scan_data.points
+        if points and hasattr(points[0], 'angle_h'):
+            get_layer = attrgetter('layer')
+            get_angle = attrgetter('angle_h')
+            get_distance = attrgetter('distance')
+        else:
+            angle_key = 'angle_h' if points and 'angle_h' in points[0] else 'angle'
+            get_layer = lambda p: p.get('layer', 0)
+            get_angle = lambda p: p.get(angle_key, 0)
+            get_distance = lambda p: p.get('distance', 0)
 
-        return distances
+        count = len(points)
+        return (np.fromiter(map(get_layer, points), dtype=np.uint8, count=count),
+                np.fromiter(map(get_angle, points), dtype=np.float32, count=count),
+                np.fromiter(map(get_distance, points), dtype=np.float32, count=count))
 
-    def _evaluate_zone(self, zone: MeasurementZone, distances: List[float]) -> Tuple[MeasurementResult, float]:
+    def _evaluate_zone(self, zone: MeasurementZone, distances: np.ndarray) -> Tuple[MeasurementResult, float]:
         """
         Evaluate a measurement zone
 
         Returns:
             Tuple of (result, measured_distance)
         """
-        if len(distances) < zone.min_points:
-            return MeasurementResult.NO_TARGET, 0.0
-
-        # Outlier rejection if enabled
-        if zone.outlier_rejection and len(distances) > 3:
-            distances = self._reject_outliers(distances, zone.outlier_std_factor)
-            if len(distances) < zone.min_points:
-                return MeasurementResult.NO_TARGET, 0.0
-
-        # Calculate measurement
-        if zone.use_median:
-            distances_sorted = sorted(distances)
-            n = len(distances_sorted)
-            if n % 2 == 0:
-                measurement = (distances_sorted[n//2 - 1] + distances_sorted[n//2]) / 2
-            else:
-                measurement = distances_sorted[n//2]
-        else:
-            measurement = sum(distances) / len(distances)
+        code, measurement = _zone_kernel(
+            distances, zone.expected_distance, zone.tolerance_plus, zone.tolerance_minus,
+            zone.min_points, zone.use_median, zone.outlier_rejection, zone.outlier_std_factor)
+        return MeasurementResult(code), measurement
 
-        # Evaluate against expected distance
-        lower_bound = zone.expected_distance - zone.tolerance_minus
-        upper_bound = zone.expected_distance + zone.tolerance_plus
+    def request_save(self) -> None:
+        """
+        Schedule a configuration save on the background writer thread
 
-        if lower_bound <= measurement <= upper_bound:
-            return MeasurementResult.GOOD, measurement
-        else:
-            return MeasurementResult.BAD, measurement
+        Edits arriving within SAVE_DELAY of each other are written once.
+        A pending save is flushed at interpreter exit.
+        """
+        if not self.config_path:
+            return
 
-    def _reject_outliers(self, distances: List[float], std_factor: float) -> List[float]:
-        """Reject outliers using standard deviation method"""
-        if len(distances) < 3:
-            return distances
+        if self._save_thread is None:
+            self._save_thread = threading.Thread(
+                target=self._config_writer_loop, name="config-writer", daemon=True)
+            self._save_thread.start()
+            atexit.register(self.flush_config)
 
-        mean = sum(distances) / len(distances)
-        variance = sum((d - mean) ** 2 for d in distances) / len(distances)
-        std = math.sqrt(variance)
+        self._save_event.set()
 
-        if std < 0.001:  # Essentially no variation
-            return distances
+    def flush_config(self) -> None:
+        """Write a pending background save immediately"""
+        if self._save_event.is_set():
+            self._save_event.clear()
+            self.save_config()
 
-        threshold = std_factor * std
-        return [d for d in distances if abs(d - mean) <= threshold]
+    def _config_writer_loop(self) -> None:
+        """Background thread: wait for save requests and coalesce them"""
+        while True:
+            self._save_event.wait()
+            time.sleep(self.SAVE_DELAY)
+            self.flush_config()
 
     def save_config(self) -> bool:
-        """Save product configurations to file"""
+        """Save product configurations to file (atomically, via a temp file)"""
         if not self.config_path:
             return False
 
         try:
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
 
-            data = {
-                'active_product_id': self.active_product_id,
-                'products': [p.to_dict() for p in self.products.values()],
-            }
-
-            with open(self.config_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            with self._lock:
+                data = {
+                    'active_product_id': self.active_product_id,
+                    'products': [p.to_dict() for p in self.products.values()],
+                }
+
+            tmp_path = self.config_path.with_name(self.config_path.name + '.tmp')
+            with self._write_lock:
+                if ORJSON_AVAILABLE:
+                    tmp_path.write_bytes(orjson.dumps(
+                        data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+                else:
+                    with open(tmp_path, 'w') as f:
+                        json.dump(data, f, indent=2)
+                os.replace(tmp_path, self.config_path)
 
             logger.info(f"Configuration saved to {self.config_path}")
             return True
@@ -410,15 +702,22 @@ class MeasurementEvaluator:
             return False
 
         try:
-            with open(self.config_path, 'r') as f:
-                data = json.load(f)
+            if ORJSON_AVAILABLE:
+                data = orjson.loads(self.config_path.read_bytes())
+            else:
+                with open(self.config_path, 'r') as f:
+                    data = json.load(f)
 
-            self.products.clear()
+            products = {}
             for p_data in data.get('products', []):
                 product = ProductConfig.from_dict(p_data)
-                self.products[product.id] = product
+                products[product.id] = product
 
-            self.active_product_id = data.get('active_product_id')
+            with self._lock:
+                self.products.clear()
+                self.products.update(products)
+                self.active_product_id = data.get('active_product_id')
+                self._publish_active_product()
 
             logger.info(f"Loaded {len(self.products)} products from {self.config_path}")
             return True
@@ -19,7 +19,7 @@ System Status (40001-40010):
 Zone 1 (40101-40120):
   40101: Zone ID
   40102: Zone Enabled (0/1)
-  40103: Zone Result (0=Unknown, 1=Good, 2=Bad, 3=NoTarget, 4=Error)
+  40103: Zone Result (0=Unknown, 1=Good, 2=Bad, 3=NoTarget, 4=Error, 5=Stale)
   40104: In Tolerance (0/1)
   40105-40106: Measurement (32-bit float, IEEE 754)
   40107-40108: Expected Distance (32-bit float)
@@ -27,7 +27,9 @@ Zone 1 (40101-40120):
   40111-40112: Tolerance Minus (32-bit float)
   40113-40114: Point Count (32-bit)
 
-Zone 2-16: Same pattern at 40201, 40301, etc.
+Zone 2-16: Same pattern at 40201, 40301, ... 41601
+  (Zone 9 at 40901 shares its first registers with the write-only
+  control registers below)
 
 Coils (Function Code 1/5):
   00001: System Running
@@ -46,7 +48,8 @@ import struct
 import threading
 import logging
 from typing import Optional, Dict, List
-import socket
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +66,23 @@ except ImportError:
     logger.warning("Install with: pip install pymodbus")
 
 
+# Register blocks, packed straight into the big-endian register buffer.
+# 32-bit values span two registers, high word first.
+_STATUS_FMT = struct.Struct('>HHHHIII')   # status, product, result, zone count, eval/good/bad counts
+_ZONE_FMT = struct.Struct('>HHHHffffI')   # id, enabled, result, in tolerance, 4 floats, point count
+_ZONE_CLEAR = bytes(_ZONE_FMT.size)
+
+# MBAP header plus function code: transaction ID, protocol ID, length, unit ID, function
+_MBAP_HDR = struct.Struct('>HHHBB')
+# Request fields shared by FC 01/03/05/06/16: address and count (or value)
+_ADDR_VALUE = struct.Struct('>HH')
+
+# Largest Modbus TCP ADU (7 byte MBAP header + 253 byte PDU)
+_MAX_ADU = 260
+# FC03 register limit; keeps the byte count within one byte and the ADU
+MAX_READ_REGISTERS = 125
+
+
 class ModbusDataStore:
     """
     Custom Modbus data store for LIDAR measurements
@@ -85,19 +105,29 @@ class ModbusDataStore:
 
     MAX_ZONES = 16
 
+    # Enough holding registers for every zone block (40001-41700)
+    REGISTER_COUNT = ZONE_BASE + MAX_ZONES * ZONE_SIZE
+
     def __init__(self):
         # Initialize data blocks
-        # Holding registers (40001-41000)
-        self.holding_registers = [0] * 1000
+        # Holding registers, stored big-endian exactly as sent on the wire
+        self.holding_registers = np.zeros(self.REGISTER_COUNT, dtype='>u2')
+        # Byte view of the same memory for struct packing and wire copies
+        self._hr_buf = memoryview(self.holding_registers.view(np.uint8))
 
-        # Coils (00001-00100)
-        self.coils = [False] * 100
+        # Coils (00001-00100), one 0/1 byte each
+        self.coils = np.zeros(100, dtype=np.uint8)
 
         # Input registers (30001-31000) - read only
         self.input_registers = [0] * 1000
 
-        # Thread lock
+        # Writers serialize on the lock. Readers don't take it: they copy,
+        # and only retry under the lock if _seq was odd (update in
+        # progress) or moved meanwhile.
+        # Single slice stores are atomic under the GIL, so only the
+        # multi-step update_from_product bumps the sequence.
         self._lock = threading.Lock()
+        self._seq = 0
 
     def update_from_product(self, product, stats: dict) -> None:
         """
@@ -108,108 +138,148 @@ class ModbusDataStore:
             stats: Statistics dictionary
         """
         with self._lock:
-            # System status
-            self.holding_registers[0] = 1  # Running
-            self.holding_registers[1] = product.id if product else 0
-            self.holding_registers[2] = int(product.last_result) if product else 0
-            self.holding_registers[3] = len(product.zones) if product else 0
-
-            # Statistics (32-bit values split into 2 registers)
-            eval_count = stats.get('evaluation_count', 0)
-            good_count = stats.get('good_count', 0)
-            bad_count = stats.get('bad_count', 0)
-
-            self.holding_registers[4] = (eval_count >> 16) & 0xFFFF  # High word
-            self.holding_registers[5] = eval_count & 0xFFFF          # Low word
-            self.holding_registers[6] = (good_count >> 16) & 0xFFFF
-            self.holding_registers[7] = good_count & 0xFFFF
-            self.holding_registers[8] = (bad_count >> 16) & 0xFFFF
-            self.holding_registers[9] = bad_count & 0xFFFF
-
-            # Update coils
-            self.coils[self.COIL_SYSTEM_RUNNING] = True
-            overall_good = product and product.last_result == 1
-            self.coils[self.COIL_OVERALL_GOOD] = overall_good
-            self.coils[self.COIL_OVERALL_BAD] = product and product.last_result == 2
-
-            # Update zones
-            if product:
-                for i, zone in enumerate(product.zones[:self.MAX_ZONES]):
-                    self._update_zone_registers(i, zone)
-
-                # Clear unused zones
-                for i in range(len(product.zones), self.MAX_ZONES):
-                    self._clear_zone_registers(i)
-
-    def _update_zone_registers(self, zone_index: int, zone) -> None:
-        """Update registers for a single zone"""
-        base = self.ZONE_BASE + (zone_index * self.ZONE_SIZE)
-
-        self.holding_registers[base + 0] = zone.id
-        self.holding_registers[base + 1] = 1 if zone.enabled else 0
-        self.holding_registers[base + 2] = int(zone.last_result)
-        self.holding_registers[base + 3] = 1 if zone.last_result == 1 else 0
+            self._seq += 1
+            try:
+                self._write_product(product, stats)
+            finally:
+                self._seq += 1
+
+    def _write_product(self, product, stats: dict) -> None:
+        """Pack status, coils and zones; caller holds the lock"""
+        # System status and statistics
+        _STATUS_FMT.pack_into(
+            self._hr_buf, self.STATUS_BASE * 2,
+            1,  # Running
+            (product.id & 0xFFFF) if product else 0,
+            int(product.last_result) if product else 0,
+            len(product.zones) if product else 0,
+            stats.get('evaluation_count', 0) & 0xFFFFFFFF,
+            stats.get('good_count', 0) & 0xFFFFFFFF,
+            stats.get('bad_count', 0) & 0xFFFFFFFF,
+        )
 
-        # Measurement as 32-bit float (2 registers)
-        measurement_bytes = struct.pack('>f', zone.last_measurement)
-        self.holding_registers[base + 4] = struct.unpack('>H', measurement_bytes[0:2])[0]
-        self.holding_registers[base + 5] = struct.unpack('>H', measurement_bytes[2:4])[0]
+        # Update coils
+        self.coils[self.COIL_SYSTEM_RUNNING] = 1
+        self.coils[self.COIL_OVERALL_GOOD] = product is not None and product.last_result == 1
+        self.coils[self.COIL_OVERALL_BAD] = product is not None and product.last_result == 2
 
-        # Expected distance as 32-bit float
-        expected_bytes = struct.pack('>f', zone.expected_distance)
-        self.holding_registers[base + 6] = struct.unpack('>H', expected_bytes[0:2])[0]
-        self.holding_registers[base + 7] = struct.unpack('>H', expected_bytes[2:4])[0]
+        # Update zones
+        if product:
+            for i, zone in enumerate(product.zones[:self.MAX_ZONES]):
+                self._update_zone_registers(i, zone)
 
-        # Tolerance plus as 32-bit float
-        tol_plus_bytes = struct.pack('>f', zone.tolerance_plus)
-        self.holding_registers[base + 8] = struct.unpack('>H', tol_plus_bytes[0:2])[0]
-        self.holding_registers[base + 9] = struct.unpack('>H', tol_plus_bytes[2:4])[0]
+            # Clear unused zones
+            for i in range(len(product.zones), self.MAX_ZONES):
+                self._clear_zone_registers(i)
 
-        # Tolerance minus as 32-bit float
-        tol_minus_bytes = struct.pack('>f', zone.tolerance_minus)
-        self.holding_registers[base + 10] = struct.unpack('>H', tol_minus_bytes[0:2])[0]
-        self.holding_registers[base + 11] = struct.unpack('>H', tol_minus_bytes[2:4])[0]
+    def _update_zone_registers(self, zone_index: int, zone) -> None:
+        """Update registers for a single zone"""
+        base = self.ZONE_BASE + (zone_index * self.ZONE_SIZE)
+        zone_good = zone.last_result == 1
 
-        # Point count as 32-bit
-        self.holding_registers[base + 12] = (zone.point_count >> 16) & 0xFFFF
-        self.holding_registers[base + 13] = zone.point_count & 0xFFFF
+        _ZONE_FMT.pack_into(
+            self._hr_buf, base * 2,
+            zone.id & 0xFFFF,
+            1 if zone.enabled else 0,
+            int(zone.last_result),
+            1 if zone_good else 0,
+            zone.last_measurement,
+            zone.expected_distance,
+            zone.tolerance_plus,
+            zone.tolerance_minus,
+            zone.point_count & 0xFFFFFFFF,
+        )
 
         # Update zone coils
-        zone_good = zone.last_result == 1
         self.coils[self.COIL_ZONE_GOOD_BASE + zone_index] = zone_good
         self.coils[self.COIL_ZONE_BAD_BASE + zone_index] = zone.last_result == 2
 
     def _clear_zone_registers(self, zone_index: int) -> None:
         """Clear registers for an unused zone"""
-        base = self.ZONE_BASE + (zone_index * self.ZONE_SIZE)
-
-        for i in range(14):
-            self.holding_registers[base + i] = 0
-
-        self.coils[self.COIL_ZONE_GOOD_BASE + zone_index] = False
-        self.coils[self.COIL_ZONE_BAD_BASE + zone_index] = False
+        offset = (self.ZONE_BASE + (zone_index * self.ZONE_SIZE)) * 2
+        self._hr_buf[offset:offset + len(_ZONE_CLEAR)] = _ZONE_CLEAR
+
+        self.coils[self.COIL_ZONE_GOOD_BASE + zone_index] = 0
+        self.coils[self.COIL_ZONE_BAD_BASE + zone_index] = 0
+
+    def _read(self, copy):
+        """Run copy() against a consistent snapshot (seqlock read)"""
+        seq = self._seq
+        if not seq & 1:
+            result = copy()
+            if self._seq == seq:
+                return result
+        # Raced an update; wait for it to finish
+        with self._lock:
+            return copy()
 
     def get_holding_registers(self, address: int, count: int) -> List[int]:
         """Get holding register values"""
-        with self._lock:
-            return self.holding_registers[address:address + count]
+        if address < 0:
+            return []
+        return self._read(lambda: self.holding_registers[address:address + count].tolist())
+
+    def get_holding_register_bytes(self, address: int, count: int) -> bytes:
+        """Get holding registers in Modbus wire format (big-endian, 2 bytes each)"""
+        if address < 0:
+            return b''
+        return self._read(lambda: self.holding_registers[address:address + count].tobytes())
+
+    def read_holding_registers_into(self, address: int, count: int,
+                                    out: bytearray, offset: int) -> int:
+        """
+        Copy holding registers in wire format into a caller-owned buffer
+
+        Returns:
+            Number of bytes written at out[offset:]
+        """
+        start = address * 2
+        end = min((address + count) * 2, self.REGISTER_COUNT * 2)
+        if start < 0 or end <= start:
+            return 0
+        size = end - start
+        dst = memoryview(out)[offset:offset + size]
+
+        # Inlined _read(): this is the FC03 hot path
+        seq = self._seq
+        dst[:] = self._hr_buf[start:end]
+        if seq & 1 or self._seq != seq:
+            with self._lock:
+                dst[:] = self._hr_buf[start:end]
+        return size
 
     def get_coils(self, address: int, count: int) -> List[bool]:
         """Get coil values"""
-        with self._lock:
-            return self.coils[address:address + count]
+        if address < 0:
+            return []
+        return self._read(lambda: self.coils[address:address + count].astype(bool).tolist())
+
+    def get_coil_bytes(self, address: int, count: int) -> bytes:
+        """Get coils in Modbus wire format (8 per byte, LSB first)"""
+        if address < 0:
+            return b''
+        return self._read(lambda: np.packbits(self.coils[address:address + count],
+                                              bitorder='little').tobytes())
+
+    def set_holding_register_bytes(self, address: int, data: bytes) -> None:
+        """Set consecutive holding registers from wire-format (big-endian) data"""
+        start = address * 2
+        end = min(start + len(data) // 2 * 2, self.REGISTER_COUNT * 2)
+        if 0 <= start < end:
+            with self._lock:
+                self._hr_buf[start:end] = data[:end - start]
 
     def set_holding_register(self, address: int, value: int) -> None:
         """Set a holding register value"""
         with self._lock:
-            if 0 <= address < len(self.holding_registers):
-                self.holding_registers[address] = value
+            if 0 <= address < self.REGISTER_COUNT:
+                self.holding_registers[address] = value & 0xFFFF
 
     def set_coil(self, address: int, value: bool) -> None:
         """Set a coil value"""
         with self._lock:
             if 0 <= address < len(self.coils):
-                self.coils[address] = value
+                self.coils[address] = 1 if value else 0
 
 
 class ModbusTCPServer:
@@ -217,6 +287,8 @@ class ModbusTCPServer:
     Modbus TCP Server for PLC integration
 
     Provides simple Modbus TCP server implementation for Rockwell PLCs.
+    All client connections are served by one asyncio event loop running
+    on a background thread.
     """
 
     def __init__(self, host: str = "0.0.0.0", port: int = 502):
@@ -231,7 +303,8 @@ class ModbusTCPServer:
         self.port = port
         self.data_store = ModbusDataStore()
         self._running = False
-        self._server_socket: Optional[socket.socket] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[asyncio.AbstractServer] = None
         self._thread: Optional[threading.Thread] = None
 
         # Callbacks for control registers
@@ -252,147 +325,157 @@ class ModbusTCPServer:
             logger.warning("Modbus server already running")
             return True
 
-        try:
-            self._server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self._server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            self._server_socket.bind((self.host, self.port))
-            self._server_socket.listen(5)
-            self._server_socket.settimeout(1.0)
-
-            self._running = True
-            self._thread = threading.Thread(target=self._server_loop, daemon=True)
-            self._thread.start()
-
-            logger.info(f"Modbus TCP server started on {self.host}:{self.port}")
-            return True
-
-        except Exception as e:
-            logger.error(f"Failed to start Modbus server: {e}")
+        # All clients are served by one event loop on a background thread
+        self._loop = asyncio.new_event_loop()
+        started = threading.Event()
+        self._thread = threading.Thread(target=self._run_loop, args=(started,),
+                                        name="modbus-tcp", daemon=True)
+        self._thread.start()
+        started.wait()
+
+        if not self._running:
+            self._thread.join()
+            self._thread = None
             return False
 
+        logger.info(f"Modbus TCP server started on {self.host}:{self.port}")
+        return True
+
     def stop(self) -> None:
         """Stop the Modbus TCP server"""
         self._running = False
 
-        if self._server_socket:
-            self._server_socket.close()
-
         if self._thread:
+            self._loop.call_soon_threadsafe(self._loop.stop)
             self._thread.join(timeout=2.0)
+            self._thread = None
 
         logger.info("Modbus TCP server stopped")
 
-    def _server_loop(self) -> None:
-        """Main server loop"""
-        while self._running:
-            try:
-                client_socket, address = self._server_socket.accept()
-                logger.debug(f"Modbus client connected: {address}")
-
-                # Handle client in separate thread
-                client_thread = threading.Thread(
-                    target=self._handle_client,
-                    args=(client_socket, address),
-                    daemon=True
-                )
-                client_thread.start()
-
-            except socket.timeout:
-                continue
-            except Exception as e:
-                if self._running:
-                    logger.error(f"Server loop error: {e}")
-
-    def _handle_client(self, client_socket: socket.socket, address) -> None:
-        """Handle a Modbus TCP client connection"""
-        client_socket.settimeout(30.0)
+    def _run_loop(self, started: threading.Event) -> None:
+        """Server thread: bind, serve until stop(), then close connections"""
+        loop = self._loop
+        asyncio.set_event_loop(loop)
 
         try:
-            while self._running:
-                # Receive MBAP header (7 bytes) + PDU
-                data = client_socket.recv(260)
-                if not data:
-                    break
-
-                if len(data) < 8:
-                    continue
+            self._server = loop.run_until_complete(
+                asyncio.start_server(self._handle_client, self.host, self.port))
+            self._running = True
+        except Exception as e:
+            logger.error(f"Failed to start Modbus server: {e}")
+        finally:
+            started.set()
 
-                # Parse MBAP header
-                transaction_id = struct.unpack('>H', data[0:2])[0]
-                protocol_id = struct.unpack('>H', data[2:4])[0]
-                length = struct.unpack('>H', data[4:6])[0]
-                unit_id = data[6]
-                function_code = data[7]
+        try:
+            if self._running:
+                loop.run_forever()
+
+            # Shut down: stop accepting, then end the client handlers
+            if self._server:
+                self._server.close()
+            tasks = asyncio.all_tasks(loop)
+            for task in tasks:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        finally:
+            self._server = None
+            loop.close()
 
-                # Handle request
-                response = self._process_request(function_code, data[8:])
+    async def _handle_client(self, reader: asyncio.StreamReader,
+                             writer: asyncio.StreamWriter) -> None:
+        """Handle a Modbus TCP client connection"""
+        address = writer.get_extra_info('peername')
+        logger.debug(f"Modbus client connected: {address}")
 
-                if response:
-                    # Build response with MBAP header
-                    resp_length = len(response) + 2  # +2 for unit_id and function_code
-                    mbap = struct.pack('>HHHB', transaction_id, protocol_id, resp_length, unit_id)
-                    client_socket.send(mbap + bytes([function_code]) + response)
+        # Response scratch buffer, reused for every reply on this connection
+        out = bytearray(_MAX_ADU)
 
-        except socket.timeout:
+        try:
+            while self._running:
+                # MBAP header and function code, then the rest of the PDU
+                header = await reader.readexactly(_MBAP_HDR.size)
+                transaction_id, protocol_id, length, unit_id, function_code = _MBAP_HDR.unpack(header)
+                if not 2 <= length <= _MAX_ADU - 6:
+                    logger.debug(f"Invalid MBAP length {length} from {address}")
+                    break
+                data = await reader.readexactly(length - 2)
+
+                # Handle request; the PDU data is written after the header
+                size = self._process_request(function_code, data, out)
+
+                if size:
+                    # Fill in MBAP header (+2 length for unit_id and function_code)
+                    _MBAP_HDR.pack_into(out, 0, transaction_id, protocol_id, size + 2,
+                                        unit_id, function_code)
+                    # The transport may keep what it can't send at once; hand it a copy
+                    writer.write(out[:_MBAP_HDR.size + size])
+                    await writer.drain()
+
+        except asyncio.IncompleteReadError:
+            pass  # Client closed the connection
+        except asyncio.CancelledError:
             pass
         except Exception as e:
             logger.debug(f"Client handler error: {e}")
         finally:
-            client_socket.close()
+            writer.close()
             logger.debug(f"Modbus client disconnected: {address}")
 
-    def _process_request(self, function_code: int, data: bytes) -> Optional[bytes]:
-        """Process a Modbus request and return response data"""
+    def _process_request(self, function_code: int, data: bytes, out: bytearray) -> int:
+        """
+        Process a Modbus request
+
+        Writes the response data (after the function code) into out,
+        starting past the MBAP header.
+
+        Returns:
+            Number of response data bytes, or 0 for no response
+        """
+        pos = _MBAP_HDR.size
 
         # Read Coils (FC 01)
         if function_code == 0x01:
             if len(data) < 4:
-                return None
-            start_addr = struct.unpack('>H', data[0:2])[0]
-            count = struct.unpack('>H', data[2:4])[0]
+                return 0
+            start_addr, count = _ADDR_VALUE.unpack_from(data)
 
-            coils = self.data_store.get_coils(start_addr, count)
             byte_count = (count + 7) // 8
-            result = [0] * byte_count
+            if byte_count > len(out) - pos - 1:
+                return 0
+            packed = self.data_store.get_coil_bytes(start_addr, count)
 
-            for i, coil in enumerate(coils):
-                if coil:
-                    result[i // 8] |= (1 << (i % 8))
-
-            return bytes([byte_count]) + bytes(result)
+            # Coils past the end of the table read as 0
+            out[pos] = byte_count
+            out[pos + 1:pos + 1 + byte_count] = packed.ljust(byte_count, b'\0')
+            return 1 + byte_count
 
         # Read Holding Registers (FC 03)
         elif function_code == 0x03:
             if len(data) < 4:
-                return None
-            start_addr = struct.unpack('>H', data[0:2])[0]
-            count = struct.unpack('>H', data[2:4])[0]
-
-            registers = self.data_store.get_holding_registers(start_addr, count)
-            byte_count = count * 2
-            result = struct.pack('>B', byte_count)
+                return 0
+            start_addr, count = _ADDR_VALUE.unpack_from(data)
 
-            for reg in registers:
-                result += struct.pack('>H', reg)
-
-            return result
+            # Registers are stored in wire format; copy the range as-is
+            byte_count = self.data_store.read_holding_registers_into(
+                start_addr, min(count, MAX_READ_REGISTERS), out, pos + 1)
+            out[pos] = byte_count
+            return 1 + byte_count
 
         # Write Single Coil (FC 05)
         elif function_code == 0x05:
             if len(data) < 4:
-                return None
-            address = struct.unpack('>H', data[0:2])[0]
-            value = struct.unpack('>H', data[2:4])[0] == 0xFF00
+                return 0
+            address, value = _ADDR_VALUE.unpack_from(data)
 
-            self.data_store.set_coil(address, value)
-            return data[:4]  # Echo request
+            self.data_store.set_coil(address, value == 0xFF00)
+            out[pos:pos + 4] = data[:4]  # Echo request
+            return 4
 
         # Write Single Register (FC 06)
         elif function_code == 0x06:
             if len(data) < 4:
-                return None
-            address = struct.unpack('>H', data[0:2])[0]
-            value = struct.unpack('>H', data[2:4])[0]
+                return 0
+            address, value = _ADDR_VALUE.unpack_from(data)
 
             # Handle control registers
             if address == ModbusDataStore.CONTROL_BASE:  # Reset stats
@@ -403,24 +486,22 @@ class ModbusTCPServer:
                     self._set_product_callback(value)
 
             self.data_store.set_holding_register(address, value)
-            return data[:4]  # Echo request
+            out[pos:pos + 4] = data[:4]  # Echo request
+            return 4
 
         # Write Multiple Registers (FC 16)
         elif function_code == 0x10:
             if len(data) < 5:
-                return None
-            start_addr = struct.unpack('>H', data[0:2])[0]
-            count = struct.unpack('>H', data[2:4])[0]
-            byte_count = data[4]
+                return 0
+            start_addr, count = _ADDR_VALUE.unpack_from(data)
 
-            for i in range(count):
-                if 5 + i * 2 + 2 <= len(data):
-                    value = struct.unpack('>H', data[5 + i * 2:7 + i * 2])[0]
-                    self.data_store.set_holding_register(start_addr + i, value)
+            # Register values arrive in wire format; store the bytes as-is
+            self.data_store.set_holding_register_bytes(start_addr, data[5:5 + count * 2])
 
-            return data[:4]  # Echo start address and count
+            out[pos:pos + 4] = data[:4]  # Echo start address and count
+            return 4
 
-        return None
+        return 0
 
     def update_from_product(self, product, stats: dict) -> None:
         """Update Modbus data from product results"""
@@ -457,7 +538,7 @@ class PyModbusServer:
             # Create data blocks
             coils = ModbusSequentialDataBlock(0, [0] * 100)
             discrete_inputs = ModbusSequentialDataBlock(0, [0] * 100)
-            holding_registers = ModbusSequentialDataBlock(0, [0] * 1000)
+            holding_registers = ModbusSequentialDataBlock(0, [0] * ModbusDataStore.REGISTER_COUNT)
             input_registers = ModbusSequentialDataBlock(0, [0] * 1000)
 
             # Create slave context
@@ -510,13 +591,10 @@ class PyModbusServer:
         # Copy to pymodbus context
         store = self._context[0]
 
-        # Update holding registers
-        for i, val in enumerate(self.data_store.holding_registers[:1000]):
-            store.setValues(3, i, [val])  # 3 = holding registers
-
-        # Update coils
-        for i, val in enumerate(self.data_store.coils[:100]):
-            store.setValues(1, i, [1 if val else 0])  # 1 = coils
+        # Update holding registers and coils, one block write each
+        registers = self.data_store.get_holding_registers(0, ModbusDataStore.REGISTER_COUNT)
+        store.setValues(3, 0, registers)  # 3 = holding registers
+        store.setValues(1, 0, self.data_store.coils.tolist())  # 1 = coils
 
     def is_running(self) -> bool:
         return self._running
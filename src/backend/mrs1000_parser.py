@@ -13,10 +13,15 @@ The MRS1000 is a multi-layer LIDAR with:
 
 import struct
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import List, Optional, Tuple
 from enum import IntEnum
 import math
 
+import numpy as np
+
+from json_codec import json_bytes
+
 
 class MRS1000Layer(IntEnum):
     """Layer indices for MRS1000 (4 layers)"""
@@ -34,6 +39,12 @@ LAYER_ANGLES = {
     MRS1000Layer.LAYER_4: 2.5,
 }
 
+# Vertical angle lookup indexed by layer number
+LAYER_ANGLE_TABLE = np.array([LAYER_ANGLES[MRS1000Layer(i)] for i in range(4)])
+
+# Magic prefix identifying a binary scan frame (see ScanData.to_binary)
+SCAN_FRAME_MAGIC = b'MRSB'
+
 
 @dataclass
 class ScanPoint:
@@ -78,21 +89,57 @@ class ScanPoint:
         }
 
 
-@dataclass
+@dataclass(eq=False)
 class ScanData:
-    """Complete scan data from MRS1000"""
+    """
+    Complete scan data from MRS1000
+
+    Point data is stored as parallel NumPy arrays (one entry per point):
+    - distances: float32, meters
+    - angles:    float32, horizontal angle in degrees
+    - rssi:      uint8
+    - layers:    uint8, layer index 0-3
+
+    float32 keeps sub-millimeter distance and 1e-5 degree angle precision
+    over the sensor's range while halving the memory the evaluator scans.
+    The per-point ScanPoint view in `points` is built on first access.
+    """
     timestamp: int              # Timestamp in microseconds
     scan_number: int           # Scan counter
     telegram_count: int        # Telegram counter
     device_status: int         # Device status flags
     frequency: float           # Scan frequency in Hz
-    points: List[ScanPoint] = field(default_factory=list)
+
+    # Point arrays
+    distances: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float32))  # Meters
+    angles: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float32))     # Horizontal, degrees
+    rssi: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.uint8))
+    layers: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.uint8))
 
     # Scan configuration
     start_angle: float = -137.5  # Start angle in degrees
     end_angle: float = 137.5     # End angle in degrees
     angular_resolution: float = 0.25  # Angular resolution in degrees
 
+    @property
+    def point_count(self) -> int:
+        """Number of points in the scan"""
+        return len(self.distances)
+
+    @cached_property
+    def points(self) -> List[ScanPoint]:
+        """Points as ScanPoint objects"""
+        return [
+            ScanPoint(distance=d, angle_h=a, angle_v=v, rssi=r, layer=l)
+            for d, a, v, r, l in zip(
+                self.distances.tolist(),
+                self.angles.tolist(),
+                LAYER_ANGLE_TABLE[self.layers].tolist(),
+                self.rssi.tolist(),
+                self.layers.tolist(),
+            )
+        ]
+
     def get_layer_points(self, layer: int) -> List[ScanPoint]:
         """Get points for a specific layer"""
         return [p for p in self.points if p.layer == layer]
@@ -108,7 +155,7 @@ class ScanData:
             'start_angle': self.start_angle,
             'end_angle': self.end_angle,
             'angular_resolution': self.angular_resolution,
-            'point_count': len(self.points),
+            'point_count': self.point_count,
             'points': [p.to_dict() for p in self.points],
             'layers': {
                 str(layer): [p.to_dict() for p in self.get_layer_points(layer)]
@@ -118,14 +165,17 @@ class ScanData:
 
     def to_compact_dict(self) -> dict:
         """Convert to compact format for efficient transmission"""
-        # Group points by layer and only send essential data
+        # Group points by layer and only send essential data (rounded in
+        # float64 so the JSON carries e.g. 2.031 rather than 2.0309998989)
+        distances = self.distances.astype(np.float64).round(3)
+        angles = self.angles.astype(np.float64).round(2)
         layers_data = {}
         for layer in range(4):
-            layer_points = self.get_layer_points(layer)
+            mask = self.layers == layer
             layers_data[str(layer)] = {
-                'distances': [round(p.distance, 3) for p in layer_points],
-                'angles': [round(p.angle_h, 2) for p in layer_points],
-                'rssi': [p.rssi for p in layer_points],
+                'distances': distances[mask].tolist(),
+                'angles': angles[mask].tolist(),
+                'rssi': self.rssi[mask].tolist(),
             }
 
         return {
@@ -140,6 +190,47 @@ class ScanData:
             'layers': layers_data,
         }
 
+    def to_binary(self) -> bytes:
+        """
+        Convert to a binary frame for efficient transmission
+
+        Frame layout (little-endian):
+        - Magic b'MRSB' (4 bytes)
+        - Header length (uint32)
+        - JSON header, space-padded to a 4-byte boundary
+        - Distances (float32 x N), horizontal angles (float32 x N), RSSI (uint8 x N)
+
+        Points are grouped by layer; the header 'counts' field gives the
+        number of points in each of the 4 layers.
+        """
+        layers = self.layers
+        order = np.argsort(layers, kind='stable')
+        distances = self.distances[order].astype('<f4', copy=False)
+        angles = self.angles[order].astype('<f4', copy=False)
+        rssi = self.rssi[order].astype(np.uint8, copy=False)
+
+        header = json_bytes({
+            'timestamp': self.timestamp,
+            'scan_number': self.scan_number,
+            'frequency': round(self.frequency, 2),
+            'config': {
+                'start_angle': self.start_angle,
+                'end_angle': self.end_angle,
+                'resolution': self.angular_resolution,
+            },
+            'counts': np.bincount(layers, minlength=4).tolist(),
+        })
+        header += b' ' * (-len(header) % 4)
+
+        return b''.join((
+            SCAN_FRAME_MAGIC,
+            struct.pack('<I', len(header)),
+            header,
+            distances.tobytes(),
+            angles.tobytes(),
+            rssi.tobytes(),
+        ))
+
 
 class MRS1000Parser:
     """
@@ -332,8 +423,16 @@ class MRS1000Parser:
             )
 
             # Parse each channel
+            channels = []
             for channel_idx in range(num_16bit_channels):
-                offset = self._parse_channel(data, offset, scan_data, channel_idx)
+                offset = self._parse_channel(data, offset, scan_data, channel_idx, channels)
+
+            if channels:
+                scan_data.layers = np.concatenate(
+                    [np.full(len(d), layer, dtype=np.uint8) for layer, d, _ in channels])
+                scan_data.distances = np.concatenate([d for _, d, _ in channels])
+                scan_data.angles = np.concatenate([a for _, _, a in channels])
+                scan_data.rssi = np.zeros(len(scan_data.distances), dtype=np.uint8)
 
             # Parse 8-bit channels (RSSI data)
             if offset < len(data):
@@ -350,8 +449,9 @@ class MRS1000Parser:
             print(f"Error parsing binary scan data: {e}")
             return None
 
-    def _parse_channel(self, data: bytes, offset: int, scan_data: ScanData, channel_idx: int) -> int:
-        """Parse a 16-bit data channel (distance data)"""
+    def _parse_channel(self, data: bytes, offset: int, scan_data: ScanData, channel_idx: int,
+                       channels: List[Tuple[int, np.ndarray, np.ndarray]]) -> int:
+        """Parse a 16-bit data channel (distance data), appending (layer, distances, angles)"""
         # Channel content (5 ASCII chars)
         content_type = data[offset:offset + 5].decode('ascii', errors='ignore')
         offset += 5
@@ -385,31 +485,19 @@ class MRS1000Parser:
 
         # Determine layer from channel index
         layer = channel_idx % 4
-        vertical_angle = LAYER_ANGLES.get(MRS1000Layer(layer), 0.0)
 
-        # Parse distance values
-        for i in range(num_points):
-            if offset + 2 > len(data):
-                break
+        # Parse distance values (truncated if the telegram is short)
+        count = max(0, min(num_points, (len(data) - offset) // 2))
+        distance_raw = np.frombuffer(data, dtype='>u2', count=count, offset=offset)
+        offset += count * 2
 
-            distance_raw = struct.unpack('>H', data[offset:offset + 2])[0]
-            offset += 2
-
-            # Convert to meters
-            distance = (distance_raw * scale_factor + scale_offset) / 1000.0
+        # Convert to meters
+        distances = (distance_raw.astype(np.float32) * scale_factor + scale_offset) / 1000.0
 
-            # Calculate horizontal angle
-            angle_h = start_angle + i * angular_step
-
-            point = ScanPoint(
-                distance=distance,
-                angle_h=angle_h,
-                angle_v=vertical_angle,
-                rssi=0,  # Will be filled by RSSI channel
-                layer=layer,
-            )
-            scan_data.points.append(point)
+        # Calculate horizontal angles
+        angles = start_angle + np.arange(count, dtype=np.float32) * angular_step
 
+        channels.append((layer, distances, angles))
         return offset
 
     def _parse_rssi_channel(self, data: bytes, offset: int, scan_data: ScanData, channel_idx: int) -> int:
@@ -438,19 +526,16 @@ class MRS1000Parser:
 
         # Determine which layer this RSSI data belongs to
         layer = channel_idx % 4
-        layer_points = scan_data.get_layer_points(layer)
+        layer_indices = np.flatnonzero(scan_data.layers == layer)
 
         # Parse RSSI values
-        for i in range(num_points):
-            if offset >= len(data):
-                break
-
-            rssi = data[offset]
-            offset += 1
+        count = max(0, min(num_points, len(data) - offset))
+        rssi = np.frombuffer(data, dtype=np.uint8, count=count, offset=offset)
+        offset += count
 
-            # Update corresponding point's RSSI
-            if i < len(layer_points):
-                layer_points[i].rssi = rssi
+        # Update corresponding points' RSSI
+        n = min(count, len(layer_indices))
+        scan_data.rssi[layer_indices[:n]] = rssi[:n]
 
         return offset
 
@@ -462,13 +547,48 @@ class MRS1000SimulatedParser:
     Generates realistic scan data patterns for visualization testing.
     """
 
+    # Scan geometry: 4 layers x 1101 beams from -137.5° to +137.5°
+    NUM_BEAMS = 1101
+
     def __init__(self):
         self.scan_count = 0
         self.time_us = 0
+        self._rng = np.random.default_rng()
+
+        # Fixed per-beam geometry, shared by every generated scan
+        beam_angles = -137.5 + 0.25 * np.arange(self.NUM_BEAMS, dtype=np.float32)
+        self._angles = np.tile(beam_angles, 4)
+        self._layers = np.repeat(np.arange(4, dtype=np.uint8), self.NUM_BEAMS)
+        self._angles.flags.writeable = False
+        self._layers.flags.writeable = False
+
+        # Static walls and box only depend on the angle
+        angles = self._angles
+        static = np.full(angles.shape, 64.0)
+        with np.errstate(divide='ignore'):
+            left = (angles >= -120) & (angles <= -60)
+            static[left] = np.minimum(static[left], 5.0 / np.abs(np.cos(np.radians(angles[left] + 90))))
+            right = (angles >= 60) & (angles <= 120)
+            static[right] = np.minimum(static[right], 5.0 / np.abs(np.cos(np.radians(angles[right] - 90))))
+        box = (angles >= -30) & (angles <= 30)
+        static[box] = np.minimum(static[box], 3.0 + 0.5 * np.sin(np.radians(angles[box] * 6)))
+        self._static_distances = static.astype(np.float32)
 
     def generate_scan(self) -> ScanData:
         """Generate a simulated scan"""
-        import random
+        rng = self._rng
+        n = len(self._angles)
+
+        # Simulate various obstacles
+        distance = self._simulate_distances()
+
+        # Add some noise
+        hit = distance < 64.0
+        distance[hit] = np.clip(distance[hit] + rng.normal(0, 0.02, np.count_nonzero(hit)), 0.1, 64.0)
+
+        # Simulate RSSI (stronger for closer objects)
+        rssi = np.where(distance < 64.0, (200 - (distance / 64.0) * 150).astype(np.int64), 0)
+        rssi = np.clip(rssi + rng.integers(-10, 11, n), 0, 255).astype(np.uint8)
 
         scan = ScanData(
             timestamp=self.time_us,
@@ -476,82 +596,39 @@ class MRS1000SimulatedParser:
             telegram_count=self.scan_count,
             device_status=0,
             frequency=12.5,
+            distances=distance,
+            angles=self._angles,
+            rssi=rssi,
+            layers=self._layers,
             start_angle=-137.5,
             end_angle=137.5,
             angular_resolution=0.25,
         )
 
-        # Generate points for each layer
-        for layer in range(4):
-            vertical_angle = LAYER_ANGLES[MRS1000Layer(layer)]
-
-            angle = -137.5
-            while angle <= 137.5:
-                # Simulate various obstacles
-                distance = self._simulate_distance(angle, layer)
-
-                # Add some noise
-                if distance < 64.0:
-                    distance += random.gauss(0, 0.02)
-                    distance = max(0.1, min(64.0, distance))
-
-                # Simulate RSSI (stronger for closer objects)
-                rssi = int(200 - (distance / 64.0) * 150) if distance < 64.0 else 0
-                rssi = max(0, min(255, rssi + random.randint(-10, 10)))
-
-                point = ScanPoint(
-                    distance=distance,
-                    angle_h=angle,
-                    angle_v=vertical_angle,
-                    rssi=rssi,
-                    layer=layer,
-                )
-                scan.points.append(point)
-
-                angle += 0.25
-
         self.scan_count += 1
         self.time_us += 80000  # 80ms per scan at 12.5Hz
 
         return scan
 
-    def _simulate_distance(self, angle: float, layer: int) -> float:
+    def _simulate_distances(self) -> np.ndarray:
         """Simulate distance measurements with various obstacles"""
-        import math
-        import random
-
-        # Default: max range (no obstacle)
-        distance = 64.0
-
-        # Simulate a wall on the left side (-120° to -60°)
-        if -120 <= angle <= -60:
-            wall_dist = 5.0 / abs(math.cos(math.radians(angle + 90)))
-            distance = min(distance, wall_dist)
-
-        # Simulate a wall on the right side (60° to 120°)
-        if 60 <= angle <= 120:
-            wall_dist = 5.0 / abs(math.cos(math.radians(angle - 90)))
-            distance = min(distance, wall_dist)
-
-        # Simulate a box/obstacle in front (-30° to 30°)
-        if -30 <= angle <= 30:
-            box_dist = 3.0 + 0.5 * math.sin(math.radians(angle * 6))
-            distance = min(distance, box_dist)
+        angles = self._angles
+        distance = self._static_distances.copy()
 
         # Simulate a person/cylinder at -45°
         person_angle = -45 + 5 * math.sin(self.scan_count * 0.1)  # Moving person
-        if abs(angle - person_angle) < 5:
-            person_dist = 2.0 + (1 - abs(angle - person_angle) / 5) * 0.3
-            distance = min(distance, person_dist)
+        offset = np.abs(angles - person_angle)
+        near = offset < 5
+        distance[near] = np.minimum(distance[near], 2.0 + (1 - offset[near] / 5) * 0.3)
 
         # Simulate another moving object at 45°
         obj_angle = 45 + 10 * math.sin(self.scan_count * 0.15)
-        if abs(angle - obj_angle) < 8:
-            obj_dist = 4.0 + (1 - abs(angle - obj_angle) / 8) * 0.5
-            distance = min(distance, obj_dist)
+        offset = np.abs(angles - obj_angle)
+        near = offset < 8
+        distance[near] = np.minimum(distance[near], 4.0 + (1 - offset[near] / 8) * 0.5)
 
         # Random noise/dust particles (occasional spurious readings)
-        if random.random() < 0.005:
-            distance = min(distance, random.uniform(0.5, 3.0))
+        dust = self._rng.random(len(distance)) < 0.005
+        distance[dust] = np.minimum(distance[dust], self._rng.uniform(0.5, 3.0, np.count_nonzero(dust)))
 
         return distance
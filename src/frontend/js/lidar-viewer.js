@@ -15,6 +15,7 @@ class LidarViewer {
 
         // WebSocket
         this.ws = null;
+        this._textDecoder = new TextDecoder();
         this.reconnectAttempts = 0;
         this.reconnectTimeout = null;
 
@@ -119,6 +120,7 @@ class LidarViewer {
 
         try {
             this.ws = new WebSocket(this.options.wsUrl);
+            this.ws.binaryType = 'arraybuffer';
 
             this.ws.onopen = () => this._onOpen();
             this.ws.onclose = (event) => this._onClose(event);
@@ -178,11 +180,21 @@ class LidarViewer {
      */
     _onMessage(event) {
         try {
-            const message = JSON.parse(event.data);
+            const isBinary = event.data instanceof ArrayBuffer;
             this.stats.messagesReceived++;
-            this.stats.bytesReceived += event.data.length;
+            this.stats.bytesReceived += isBinary ? event.data.byteLength : event.data.length;
             this.stats.lastMessageTime = Date.now();
 
+            // Binary scan frames carry typed arrays after a small header
+            if (isBinary && this._isBinaryScanFrame(event.data)) {
+                this._handleScanData(this._decodeBinaryScan(event.data));
+                return;
+            }
+
+            // Other binary frames are pre-encoded UTF-8 JSON
+            const text = isBinary ? this._textDecoder.decode(event.data) : event.data;
+            const message = JSON.parse(text);
+
             switch (message.type) {
                 case 'scan':
                     this._handleScanData(message.data);
@@ -206,6 +218,54 @@ class LidarViewer {
         }
     }
 
+    /**
+     * Check for the binary scan frame magic ('MRSB')
+     */
+    _isBinaryScanFrame(buffer) {
+        if (buffer.byteLength < 8) return false;
+        const magic = new Uint8Array(buffer, 0, 4);
+        return magic[0] === 0x4D && magic[1] === 0x52 && magic[2] === 0x53 && magic[3] === 0x42;
+    }
+
+    /**
+     * Decode a binary scan frame into the compact scan format
+     *
+     * Layout (little-endian): magic, uint32 header length, JSON header padded
+     * to 4 bytes, then float32 distances, float32 angles and uint8 RSSI for
+     * all points grouped by layer (per-layer counts in the header).
+     */
+    _decodeBinaryScan(buffer) {
+        const headerLength = new DataView(buffer).getUint32(4, true);
+        const header = JSON.parse(this._textDecoder.decode(new Uint8Array(buffer, 8, headerLength)));
+        const total = header.counts.reduce((sum, count) => sum + count, 0);
+
+        let offset = 8 + headerLength;
+        const distances = new Float32Array(buffer, offset, total);
+        offset += total * 4;
+        const angles = new Float32Array(buffer, offset, total);
+        offset += total * 4;
+        const rssi = new Uint8Array(buffer, offset, total);
+
+        const layers = {};
+        let start = 0;
+        header.counts.forEach((count, layer) => {
+            layers[String(layer)] = {
+                distances: distances.subarray(start, start + count),
+                angles: angles.subarray(start, start + count),
+                rssi: rssi.subarray(start, start + count),
+            };
+            start += count;
+        });
+
+        return {
+            timestamp: header.timestamp,
+            scan_number: header.scan_number,
+            frequency: header.frequency,
+            config: header.config,
+            layers,
+        };
+    }
+
     /**
      * Handle scan data from server
      */